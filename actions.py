@@ -1,16 +1,44 @@
 # actions.py
+import io
 import os
 from tkinter import filedialog, messagebox
 from PIL import Image
 
 from timlib import (
-    render_tim_to_image,
     export_indices_png_and_meta,
     import_indices_from_png_resize_tim,
-    build_tim_bytes,
+    tim_sections,
 )
 
 
+# Large output buffer so multi-MB TIM/PNG payloads go out in a few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _write_file_buffered(path, *chunks):
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for chunk in chunks:
+            f.write(memoryview(chunk))
+
+
+def _flatten_for_bmp(pil):
+    """
+    BMP has no alpha: composite onto black. Images without real transparency
+    are converted directly, skipping the composite.
+    """
+    if pil.mode in ("RGB", "L", "P") and "transparency" not in pil.info:
+        return pil.convert("RGB")
+
+    rgba = pil.convert("RGBA")
+    alpha = rgba.getchannel("A")
+    if alpha.getextrema() == (255, 255):
+        return rgba.convert("RGB")
+
+    flat = Image.new("RGB", rgba.size, (0, 0, 0))
+    flat.paste(rgba, mask=alpha)
+    return flat
+
+
 def export_indices(app):
     if app.current_tim is None:
         messagebox.showinfo("No TIM selected", "Select a TIM first.")
@@ -19,7 +47,7 @@ def export_indices(app):
         messagebox.showinfo("Not indexed", "This TIM is not indexed (4bpp/8bpp).")
         return
 
-    base = os.path.splitext(os.path.basename(app.current_tim.path))[0]
+    base = app.current_tim.stem
     suggested = base + "_index.png"
     out_path = filedialog.asksaveasfilename(
         title="Export Indices PNG",
@@ -67,6 +95,7 @@ def import_indices_resize(app):
         messagebox.showerror("Import indices failed", str(e))
         return
 
+    app.forget_parsed_tim(app.current_tim)
     app.rebuild_sheet_and_frames(auto=True)
     app.set_status(extra=" | Imported+resized")
     messagebox.showinfo(
@@ -80,7 +109,7 @@ def save_tim_as(app):
         messagebox.showinfo("No TIM selected", "Select a TIM first.")
         return
 
-    base = os.path.splitext(os.path.basename(app.current_tim.path))[0]
+    base = app.current_tim.stem
     suggested = base + "_edited.tim"
     out_path = filedialog.asksaveasfilename(
         title="Save TIM As",
@@ -92,15 +121,23 @@ def save_tim_as(app):
         return
 
     try:
-        out_bytes = build_tim_bytes(app.current_tim)
-        with open(out_path, "wb") as f:
-            f.write(out_bytes)
+        # Snapshot the sections on the Tk thread (the TIM may be edited later);
+        # no payload copy, and nothing touches disk if validation fails
+        parts = tim_sections(app.current_tim)
     except Exception as e:
         messagebox.showerror("Save failed", str(e))
         return
 
-    app.set_status(extra=" | Saved")
-    messagebox.showinfo("Saved", f"Wrote:\n{out_path}")
+    def _on_written(fut):
+        try:
+            fut.result()
+        except Exception as e:
+            messagebox.showerror("Save failed", str(e))
+            return
+        app.set_status(extra=" | Saved")
+        messagebox.showinfo("Saved", f"Wrote:\n{out_path}")
+
+    app.submit_io(_write_file_buffered, out_path, *parts, on_done=_on_written)
 
 
 def export_image(app):
@@ -113,11 +150,14 @@ def export_image(app):
         suffix = f"_frame{app.current_frame_idx:02d}"
     else:
         if app.current_sheet_pil is None:
-            app.current_sheet_pil = render_tim_to_image(app.current_tim, app.current_tim.applied_clut)
+            # Same path as selection, so the sheet cache can serve it
+            app.rebuild_sheet_and_frames(auto=True)
+            if app.current_sheet_pil is None:
+                return  # render failed; rebuild already reported it
         pil = app.current_sheet_pil
         suffix = ""
 
-    base = os.path.splitext(os.path.basename(app.current_tim.path))[0]
+    base = app.current_tim.stem
     suggested = base + suffix + ".png"
 
     out_path = filedialog.asksaveasfilename(
@@ -131,13 +171,12 @@ def export_image(app):
 
     ext = os.path.splitext(out_path)[1].lower().strip(".")
     try:
+        buf = io.BytesIO()
         if ext == "bmp":
-            rgba = pil.convert("RGBA")
-            bg = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
-            flat = Image.alpha_composite(bg, rgba).convert("RGB")
-            flat.save(out_path, "BMP")
+            _flatten_for_bmp(pil).save(buf, "BMP")
         else:
-            pil.save(out_path, "PNG")
+            pil.save(buf, "PNG")
+        _write_file_buffered(out_path, buf.getbuffer())
     except Exception as e:
         messagebox.showerror("Export failed", str(e))
         return
@@ -1,6 +1,9 @@
 # app.py
 import os
+import queue
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, ttk
 from typing import List, Optional
 
@@ -13,11 +16,31 @@ from viewport import ViewportCanvas
 from timlib import (
     TimImage, TimClut,
     parse_tim, extract_cluts_from_raw_block,
-    render_tim_to_image,
+    render_tim_to_image_cached,
     auto_detect_frames, slice_frames_fixed,
 )
 
 
+# Sliced frame lists kept around for quick TIM/CLUT re-selection
+_FRAMES_CACHE_MAX = 16
+_TIM_CACHE_MAX = 64
+
+# Upper bound on zoomed pixels held as per-frame PhotoImages during playback
+_FRAME_PHOTO_BUDGET_PX = 16_000_000
+
+_BPP_NAMES = {0: "4bpp", 1: "8bpp", 2: "16bpp", 3: "24bpp"}
+
+
+def _bpp_name(bpp_mode: int) -> str:
+    return _BPP_NAMES.get(bpp_mode, f"mode{bpp_mode}")
+
+
+def _parse_tim_with_cluts(path: str):
+    # Runs on the I/O pool: no Tk access here
+    t = parse_tim(path)
+    return t, extract_cluts_from_raw_block(t)
+
+
 class TimViewerApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -32,13 +55,54 @@ class TimViewerApp(tk.Tk):
         self.current_frames_pil = []
         self.current_frame_idx: int = 0
 
+        # Zoomed PhotoImage per frame (built lazily), valid for _frames_tk_zoom only
+        self.current_frames_tk: List[Optional[object]] = []
+        self._frames_tk_zoom: Optional[float] = None
+        # after() id of the background pass filling current_frames_tk while playing
+        self._warm_photos_id: Optional[str] = None
+
+        # Image most recently handed to the viewport (skip identical re-pushes)
+        self._last_pushed_pil = None
+
+        # (id(sheet), fw, fh, direction) -> (sheet, frames); sheet kept so a reused id can't alias
+        self._frames_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # (abspath, mtime_ns, size) -> (TimImage, its CLUT rows); skips re-parsing re-picked files
+        self._tim_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+        # File parsing/writing runs here; results come back through _post()
+        self._io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        # Calls from worker threads, run on the Tk loop by _drain_posted()
+        self._posted: "queue.Queue[tuple]" = queue.Queue()
+        self._post_poll_ms = 15
+        self._posted_after_id: Optional[str] = None
+        self._drain_posted()
+        # In-flight load_tims batch: per-path (tim, cluts) or error string, and how many are pending
+        self._load_gen = 0
+        self._load_results: list = []
+        self._load_left = 0
+
         self._anim_after_id: Optional[str] = None
+
+        # Status line minus the per-call suffix; see _update_status_prefix()
+        self._status_prefix: str = ""
+
+        # after_idle coalescing for slider drags
+        self._pending_zoom_id: Optional[str] = None
+        self._pending_scrub_id: Optional[str] = None
         self._controls_win: Optional[tk.Toplevel] = None
 
 
         # Build UI (widgets + viewport)
         ui_controls.build_ui(self)
 
+        # Playback settings, recomputed only when the user edits them
+        self._anim_delay_ms: int = 125
+        self._anim_loop: bool = True
+        self.fps_var.trace_add("write", self._recalc_anim_delay)
+        self.loop_var.trace_add("write", self._recalc_anim_loop)
+        self._recalc_anim_delay()
+        self._recalc_anim_loop()
+
         # Install input controller (all bindings live there)
         self.input = InputController(self, self.viewport)
         self.input.install()
@@ -130,16 +194,23 @@ class TimViewerApp(tk.Tk):
     # -----------------------------
     # Status helper
     # -----------------------------
-    def set_status(self, extra: str = ""):
+    def _update_status_prefix(self):
+        # Call whenever the TIM, CLUT, frame list, or animate toggle changes
         if self.current_tim is None:
-            self.info_var.set("Load TIMs to begin.")
+            self._status_prefix = ""
             return
 
-        base = os.path.basename(self.current_tim.path)
-        bpp_name = {0: "4bpp", 1: "8bpp", 2: "16bpp", 3: "24bpp"}.get(self.current_tim.bpp_mode, f"mode{self.current_tim.bpp_mode}")
+        base = self.current_tim.basename
+        bpp_name = _bpp_name(self.current_tim.bpp_mode)
         pal = self.current_tim.applied_clut.label if self.current_tim.applied_clut else "(no CLUT)"
         frames = f" | frames {len(self.current_frames_pil)}" if (self.anim_enable.get() and self.current_frames_pil) else ""
-        self.info_var.set(f"{base} | {bpp_name} | {self.current_tim.pixel_width()}×{self.current_tim.img_h}{frames} | CLUT: {pal}{extra}")
+        self._status_prefix = f"{base} | {bpp_name} | {self.current_tim.pixel_width()}×{self.current_tim.img_h}{frames} | CLUT: {pal}"
+
+    def set_status(self, extra: str = ""):
+        if self.current_tim is None:
+            self.info_var.set("Load TIMs to begin.")
+            return
+        self.info_var.set(self._status_prefix + extra)
 
     # -----------------------------
     # Load / select
@@ -152,17 +223,104 @@ class TimViewerApp(tk.Tk):
         if not paths:
             return
 
+        # Newer batches supersede older ones still in flight
+        self._load_gen += 1
+        gen = self._load_gen
+        self._load_results = [None] * len(paths)
+
+        pending = []
+        for i, p in enumerate(paths):
+            try:
+                key = self._tim_cache_key(p)
+            except Exception as e:
+                self._load_results[i] = f"{os.path.basename(p)}: {e}"
+                continue
+            hit = self._tim_cache.get(key)
+            if hit is not None:
+                self._tim_cache.move_to_end(key)
+                self._load_results[i] = hit
+            else:
+                pending.append((i, p, key))
+
+        self._load_left = len(pending)
+        if not pending:
+            self._finish_load()
+            return
+
+        self.load_progress.configure(maximum=len(paths), value=len(paths) - len(pending))
+        self.load_progress.grid()
+        self.info_var.set(f"Loading {len(pending)} TIM(s)…")
+
+        for i, p, key in pending:
+            self.submit_io(
+                _parse_tim_with_cluts, p,
+                on_done=lambda f, i=i, p=p, key=key: self._on_tim_parsed(gen, i, p, key, f),
+            )
+
+    def submit_io(self, fn, *args, on_done):
+        """
+        Run fn(*args) on the I/O pool; on_done(future) is then called on the Tk thread.
+        """
+        fut = self._io_pool.submit(fn, *args)
+        fut.add_done_callback(lambda f: self._post(on_done, f))
+        return fut
+
+    def _post(self, fn, *args):
+        # Worker threads only queue the call; _drain_posted runs it on the Tk loop.
+        # Calling after() from a worker needs a threaded Tcl build, and on other
+        # builds the call would fail (and the result be lost) without a word.
+        self._posted.put((fn, args))
+
+    def _drain_posted(self):
+        # Re-arm first: a raising callback must not stop the polling
+        self._posted_after_id = self.after(self._post_poll_ms, self._drain_posted)
+        while True:
+            try:
+                fn, args = self._posted.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
+
+    @staticmethod
+    def _tim_cache_key(path: str) -> tuple:
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def _on_tim_parsed(self, gen: int, i: int, path: str, key: tuple, fut):
+        if gen != self._load_gen:
+            return
+
+        try:
+            hit = fut.result()
+        except Exception as e:
+            self._load_results[i] = f"{os.path.basename(path)}: {e}"
+        else:
+            self._load_results[i] = hit
+            self._tim_cache[key] = hit
+            while len(self._tim_cache) > _TIM_CACHE_MAX:
+                self._tim_cache.popitem(last=False)
+
+        self._load_left -= 1
+        self.load_progress.step(1)
+        if self._load_left == 0:
+            self._finish_load()
+
+    def _finish_load(self):
+        self.load_progress.grid_remove()
+
         loaded: List[TimImage] = []
         cluts: List[TimClut] = []
         errors: List[str] = []
 
-        for p in paths:
-            try:
-                t = parse_tim(p)
+        # Keep the user's selection order regardless of completion order
+        for r in self._load_results:
+            if isinstance(r, str):
+                errors.append(r)
+            else:
+                t, t_cluts = r
                 loaded.append(t)
-                cluts.extend(extract_cluts_from_raw_block(t))
-            except Exception as e:
-                errors.append(f"{os.path.basename(p)}: {e}")
+                cluts.extend(t_cluts)
+        self._load_results = []
 
         if not loaded:
             messagebox.showerror("No TIMs loaded", "Could not load any TIM files.\n\n" + "\n".join(errors[:20]))
@@ -171,15 +329,13 @@ class TimViewerApp(tk.Tk):
         self.tim_files = loaded
         self.all_cluts = cluts
 
+        # One multi-item insert per list instead of one Tk call per row
         self.files_list.delete(0, tk.END)
-        for t in self.tim_files:
-            base = os.path.basename(t.path)
-            bpp_name = {0: "4bpp", 1: "8bpp", 2: "16bpp", 3: "24bpp"}.get(t.bpp_mode, f"mode{t.bpp_mode}")
-            self.files_list.insert(tk.END, f"{base} [{bpp_name}]")
+        self.files_list.insert(tk.END, *[f"{t.basename} [{_bpp_name(t.bpp_mode)}]" for t in self.tim_files])
 
         self.clut_list.delete(0, tk.END)
-        for c in self.all_cluts:
-            self.clut_list.insert(tk.END, c.label)
+        if self.all_cluts:
+            self.clut_list.insert(tk.END, *[c.label for c in self.all_cluts])
 
         self.files_list.selection_clear(0, tk.END)
         self.files_list.selection_set(0)
@@ -193,6 +349,11 @@ class TimViewerApp(tk.Tk):
         if errors:
             messagebox.showwarning("Some files failed", "\n".join(errors[:25]))
 
+    def forget_parsed_tim(self, tim: TimImage):
+        # Call after editing a TIM in memory so re-loading its file parses it fresh
+        for key in [k for k, (t, _) in self._tim_cache.items() if t is tim]:
+            del self._tim_cache[key]
+
     def on_select_file(self, _evt=None):
         sel = self.files_list.curselection()
         if not sel:
@@ -206,6 +367,7 @@ class TimViewerApp(tk.Tk):
                 self.current_tim.applied_clut = own[0]
 
         self.rebuild_sheet_and_frames(auto=True)
+        self._update_status_prefix()
         self.set_status()
 
     def on_select_clut(self, _evt=None):
@@ -222,6 +384,7 @@ class TimViewerApp(tk.Tk):
 
         self.current_tim.applied_clut = c
         self.rebuild_sheet_and_frames(auto=False)
+        self._update_status_prefix()
         self.set_status()
 
     # -----------------------------
@@ -231,20 +394,35 @@ class TimViewerApp(tk.Tk):
         if not self.anim_enable.get():
             self.pause_anim()
         self._push_current_pil_to_viewport(recenter=False, force=True)
+        self._update_status_prefix()
         self.set_status()
 
+    def _slice_frames_cached(self, sheet, fw: int, fh: int, direction: str):
+        key = (id(sheet), fw, fh, direction)
+        hit = self._frames_cache.get(key)
+        if hit is not None and hit[0] is sheet:
+            self._frames_cache.move_to_end(key)
+            return hit[1]
+
+        frames = slice_frames_fixed(sheet, fw, fh, direction)
+        self._frames_cache[key] = (sheet, frames)
+        while len(self._frames_cache) > _FRAMES_CACHE_MAX:
+            self._frames_cache.popitem(last=False)
+        return frames
+
     def rebuild_sheet_and_frames(self, auto: bool):
         self.pause_anim()
         if self.current_tim is None:
             return
 
         try:
-            sheet = render_tim_to_image(self.current_tim, self.current_tim.applied_clut)
+            sheet = render_tim_to_image_cached(self.current_tim, self.current_tim.applied_clut)
         except Exception as e:
             messagebox.showerror("Render error", str(e))
             return
 
         self.current_sheet_pil = sheet
+        self._last_pushed_pil = None
 
         if auto:
             fw, fh, direction, count = auto_detect_frames(sheet.width, sheet.height)
@@ -259,6 +437,7 @@ class TimViewerApp(tk.Tk):
     def rebuild_frames(self):
         if self.current_sheet_pil is None:
             self.current_frames_pil = []
+            self._reset_frame_photos()
             self.current_frame_idx = 0
             self.scrub.configure(to=0)
             self.scrub_var.set(0)
@@ -273,8 +452,9 @@ class TimViewerApp(tk.Tk):
         if fw <= 0 or fh <= 0:
             fw, fh, direction, _ = auto_detect_frames(sheet.width, sheet.height)
 
-        frames = slice_frames_fixed(sheet, fw, fh, direction)
+        frames = self._slice_frames_cached(sheet, fw, fh, direction)
         self.current_frames_pil = frames
+        self._reset_frame_photos()
         self.current_frame_idx = max(0, min(self.current_frame_idx, len(frames) - 1)) if frames else 0
 
         max_idx = max(0, len(frames) - 1)
@@ -282,12 +462,16 @@ class TimViewerApp(tk.Tk):
         self.scrub_var.set(self.current_frame_idx)
 
         self._push_current_pil_to_viewport(recenter=True, force=True)
+        self._update_status_prefix()
         self.set_status()
+        self._schedule_photo_warmup()
 
     def play_anim(self):
         if not self.anim_enable.get():
             self.anim_enable.set(True)
+            self._update_status_prefix()
             self.set_status()
+        self._schedule_photo_warmup()
         self._tick_anim()
 
     def pause_anim(self):
@@ -298,18 +482,25 @@ class TimViewerApp(tk.Tk):
                 pass
             self._anim_after_id = None
 
+    def _recalc_anim_delay(self, *_args):
+        try:
+            fps = float(self.fps_var.get() or 8.0)
+        except (tk.TclError, ValueError):
+            return  # mid-edit (e.g. empty entry): keep the previous delay
+        fps = max(0.5, min(60.0, fps))
+        self._anim_delay_ms = int(round(1000.0 / fps))
+
+    def _recalc_anim_loop(self, *_args):
+        self._anim_loop = bool(self.loop_var.get())
+
     def _tick_anim(self):
         if not (self.anim_enable.get() and self.current_frames_pil):
             self._anim_after_id = None
             return
 
-        fps = float(self.fps_var.get() or 8.0)
-        fps = max(0.5, min(60.0, fps))
-        delay = int(round(1000.0 / fps))
-
         nxt = self.current_frame_idx + 1
         if nxt >= len(self.current_frames_pil):
-            if self.loop_var.get():
+            if self._anim_loop:
                 nxt = 0
             else:
                 self.pause_anim()
@@ -319,9 +510,15 @@ class TimViewerApp(tk.Tk):
         self.scrub_var.set(self.current_frame_idx)
         self._push_current_pil_to_viewport(recenter=False, force=True)
 
-        self._anim_after_id = self.after(delay, self._tick_anim)
+        self._anim_after_id = self.after(self._anim_delay_ms, self._tick_anim)
 
     def on_scrub(self):
+        # Collapse a burst of scale callbacks into one viewport push per idle pass
+        if self._pending_scrub_id is None:
+            self._pending_scrub_id = self.after_idle(self._apply_scrub)
+
+    def _apply_scrub(self):
+        self._pending_scrub_id = None
         if not self.current_frames_pil:
             return
         try:
@@ -340,14 +537,76 @@ class TimViewerApp(tk.Tk):
             return self.current_frames_pil[self.current_frame_idx]
         return self.current_sheet_pil
 
+    def _reset_frame_photos(self):
+        self.current_frames_tk = [None] * len(self.current_frames_pil)
+        self._frames_tk_zoom = None
+
+    def _frame_photo(self, idx: int):
+        """
+        Zoomed PhotoImage for frame idx, converted once and reused on later
+        animation cycles. Returns None if the frames are too large to keep.
+        """
+        frames = self.current_frames_pil
+        z = self.viewport.get_zoom()
+        if self._frames_tk_zoom != z:
+            self.current_frames_tk = [None] * len(frames)
+            self._frames_tk_zoom = z
+
+        fw, fh = frames[idx].size
+        if fw * fh * z * z * len(frames) > _FRAME_PHOTO_BUDGET_PX:
+            return None
+
+        photo = self.current_frames_tk[idx]
+        if photo is None:
+            photo = self.viewport.make_prescaled_photo(frames[idx])
+            self.current_frames_tk[idx] = photo
+        return photo
+
+    def _schedule_photo_warmup(self):
+        if self._warm_photos_id is None:
+            self._warm_photos_id = self.after_idle(self._warm_frame_photos)
+
+    def _warm_frame_photos(self):
+        # Convert one missing frame per pass so the first playback cycle is
+        # already served from current_frames_tk without stalling the UI.
+        self._warm_photos_id = None
+        if not (self.anim_enable.get() and self.current_frames_pil):
+            return
+        if self._frames_tk_zoom != self.viewport.get_zoom():
+            idx = 0
+        else:
+            try:
+                idx = self.current_frames_tk.index(None)
+            except ValueError:
+                return
+        if self._frame_photo(idx) is None:
+            return  # over budget: frames are pushed through set_image instead
+        self._warm_photos_id = self.after(1, self._warm_frame_photos)
+
     def _push_current_pil_to_viewport(self, *, recenter: bool, force: bool):
         # Keep viewport zoom synced to slider value
         self.viewport.set_zoom(float(self.zoom_var.get() or 1.0), recenter=False, force=False)
-        self.viewport.set_image(self._current_pil_for_view(), recenter=recenter, force=force)
+        pil = self._current_pil_for_view()
+        if pil is self._last_pushed_pil and not recenter:
+            return
+        self._last_pushed_pil = pil
+
+        if not recenter and self.anim_enable.get() and self.current_frames_pil:
+            photo = self._frame_photo(self.current_frame_idx)
+            if photo is not None and self.viewport.set_prescaled_image(pil, photo):
+                return
+
+        self.viewport.set_image(pil, recenter=recenter, force=force)
 
     def _on_zoom_slider(self):
-        # slider controls zoom but does not recenter
+        # slider controls zoom but does not recenter; latest value wins on idle
+        if self._pending_zoom_id is None:
+            self._pending_zoom_id = self.after_idle(self._apply_zoom)
+
+    def _apply_zoom(self):
+        self._pending_zoom_id = None
         self.viewport.set_zoom(float(self.zoom_var.get() or 1.0), recenter=False, force=False)
+        self._schedule_photo_warmup()
 
     def zoom_fit(self):
         self.viewport.zoom_fit()
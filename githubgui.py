@@ -1,8 +1,17 @@
 import os
+import queue
+import stat
 import subprocess
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 
+# Output panel keeps at most this many lines (oldest dropped first)
+OUTPUT_MAX_LINES = 5000
+
+# Read buffer for git's stdout/stderr pipes (large diffs/logs)
+PIPE_BUFSIZE = 1 << 16
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -12,24 +21,58 @@ def run_cmd(cmd, cwd, shell=False):
     Run a command and return (exit_code, stdout+stderr).
     """
     try:
+        # Capture raw bytes and decode once at the end
         p = subprocess.run(
             cmd,
             cwd=cwd,
             shell=shell,
-            text=True,
-            capture_output=True
+            capture_output=True,
+            bufsize=PIPE_BUFSIZE,
         )
-        out = ""
-        if p.stdout:
-            out += p.stdout
+        out = p.stdout or b""
         if p.stderr:
-            out += ("\n" if out else "") + p.stderr
-        return p.returncode, out.strip()
+            out += (b"\n" if out else b"") + p.stderr
+        return p.returncode, out.decode("utf-8", "replace").strip()
     except Exception as e:
         return 999, f"Exception running command: {e}"
 
+def stream_cmd(cmd, cwd, on_line):
+    """
+    Run a command, calling on_line(text) for each output line as it arrives.
+    stderr is merged into stdout. Returns the exit code.
+    """
+    try:
+        p = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=PIPE_BUFSIZE,
+        )
+    except Exception as e:
+        on_line(f"Exception running command: {e}")
+        return 999
+
+    with p:
+        for line in iter(p.stdout.readline, b""):
+            on_line(line.decode("utf-8", "replace").rstrip("\r\n"))
+    return p.returncode
+
 def looks_like_git_repo(path):
-    return os.path.isdir(os.path.join(path, ".git"))
+    # Single stat; also implies `path` itself exists
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(path, ".git")).st_mode)
+    except OSError:
+        return False
+
+def parse_branch_head(porcelain_v2_out):
+    """
+    Branch name from `git status --porcelain=v2 --branch` output, or None.
+    """
+    for line in porcelain_v2_out.splitlines():
+        if line.startswith("# branch.head "):
+            return line[len("# branch.head "):].strip()
+    return None
 
 def which_git():
     # Basic check that "git" is available
@@ -50,8 +93,29 @@ class GitHelperUI(tk.Tk):
         self.commit_msg = tk.StringVar(value="Update")
         self.tag_name = tk.StringVar(value="v1.0.0")
 
+        # git commands run here so the Tk loop never blocks on network I/O
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        # Calls from worker threads, run on the Tk loop by _drain_posted()
+        self._posted = queue.Queue()
+        self._post_poll_ms = 15
+        self._posted_after_id = None
+        self._drain_posted()
+        self._busy = False
+
+        # `git --version` output once it has succeeded; it won't change while we run
+        self._git_version = None
+
+        # Output lines waiting for the next idle flush into the Text widget
+        self._out_pending = []
+        self._out_flush_id = None
+
         self._build_ui()
         self._refresh_repo_status()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
     def _build_ui(self):
         top = ttk.Frame(self, padding=10)
@@ -152,7 +216,8 @@ class GitHelperUI(tk.Tk):
             self.action_list.insert(tk.END, a["name"])
         self.action_list.bind("<<ListboxSelect>>", self._on_action_select)
 
-        ttk.Button(left, text="Run Selected", command=self._run_selected).pack(fill="x")
+        self.run_btn = ttk.Button(left, text="Run Selected", command=self._run_selected)
+        self.run_btn.pack(fill="x")
         ttk.Button(left, text="Clear Output", command=self._clear_output).pack(fill="x", pady=(6, 0))
 
         # Description box
@@ -184,21 +249,26 @@ class GitHelperUI(tk.Tk):
             self._refresh_repo_status()
 
     def _refresh_repo_status(self):
-        ok_git, git_ver = which_git()
+        if self._git_version is None:
+            ok_git, git_ver = which_git()
+            if not ok_git:
+                self.repo_info_label.config(text="Git not found. Install Git for Windows first (git-scm.com).")
+                return
+            self._git_version = git_ver
+        git_ver = self._git_version
         path = self.repo_path.get().strip()
 
-        if not ok_git:
-            self.repo_info_label.config(text="Git not found. Install Git for Windows first (git-scm.com).")
-            return
-
-        if not os.path.isdir(path):
+        is_repo = looks_like_git_repo(path)
+        if not is_repo and not os.path.isdir(path):
             self.repo_info_label.config(text="Folder does not exist.")
             return
 
-        if looks_like_git_repo(path):
+        if is_repo:
             # show branch too
-            code, branch = run_cmd(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
-            branch = branch if code == 0 else "(unknown branch)"
+            code, out = run_cmd(
+                ["git", "status", "--porcelain=v2", "--branch", "--untracked-files=no"], cwd=path
+            )
+            branch = (parse_branch_head(out) if code == 0 else None) or "(unknown branch)"
             self.repo_info_label.config(
                 text=f"Git OK: {git_ver} | Repo: OK | Branch: {branch} | Path: {path}"
             )
@@ -222,9 +292,25 @@ class GitHelperUI(tk.Tk):
         self.desc.configure(state="disabled")
 
     def _append_output(self, text):
-        if not text:
+        if text is None:
+            return
+        # Queue and flush once per idle pass: one insert/see for a whole burst of lines
+        self._out_pending.append(text)
+        if self._out_flush_id is None:
+            self._out_flush_id = self.after_idle(self._flush_output)
+
+    def _flush_output(self):
+        self._out_flush_id = None
+        if not self._out_pending:
             return
-        self.output.insert(tk.END, text + "\n")
+        block = "\n".join(self._out_pending) + "\n"
+        self._out_pending = []
+        self.output.insert(tk.END, block)
+
+        lines = int(self.output.index("end-1c").split(".")[0])
+        if lines > OUTPUT_MAX_LINES:
+            self.output.delete("1.0", f"{lines - OUTPUT_MAX_LINES + 1}.0")
+
         self.output.see(tk.END)
 
     def _clear_output(self):
@@ -250,40 +336,70 @@ class GitHelperUI(tk.Tk):
             return
         a = self.actions[idxs[0]]
 
-        # Build dynamic commands
+        # Build dynamic commands as (label, cmd) steps; later steps only run if earlier ones succeed
         if a["cmd"] == "COMMIT_DYNAMIC":
             msg = self.commit_msg.get().strip()
             if not msg:
                 messagebox.showerror("Missing message", "Enter a commit message first.")
                 return
-            cmd = ["git", "commit", "-m", msg]
-            label = f"$ git commit -m \"{msg}\""
+            steps = [(f"$ git commit -m \"{msg}\"", ["git", "commit", "-m", msg])]
         elif a["cmd"] == "TAG_DYNAMIC":
             tag = self.tag_name.get().strip()
             if not tag:
                 messagebox.showerror("Missing tag", "Enter a tag name first (ex: v1.2.0).")
                 return
             # We'll create tag then push it
-            self._append_output(f"$ git tag {tag}")
-            code1, out1 = run_cmd(["git", "tag", tag], cwd=path)
-            self._append_output(out1 if out1 else "(no output)")
-            if code1 != 0:
-                self._append_output(f"(exit {code1})")
-                return
-
-            self._append_output(f"$ git push origin {tag}")
-            code2, out2 = run_cmd(["git", "push", "origin", tag], cwd=path)
-            self._append_output(out2 if out2 else "(no output)")
-            self._append_output(f"(exit {code2})\n")
-            return
+            steps = [
+                (f"$ git tag {tag}", ["git", "tag", tag]),
+                (f"$ git push origin {tag}", ["git", "push", "origin", tag]),
+            ]
         else:
             cmd = a["cmd"]
-            label = "$ " + " ".join(cmd)
+            steps = [("$ " + " ".join(cmd), cmd)]
 
-        self._append_output(label)
-        code, out = run_cmd(cmd, cwd=path)
-        self._append_output(out if out else "(no output)")
-        self._append_output(f"(exit {code})\n")
+        if self._busy:
+            return
+        self._set_busy(True)
+        fut = self._pool.submit(self._run_steps, steps, path)
+        fut.add_done_callback(lambda _f: self._post(self._set_busy, False))
+
+    # -----------------------------
+    # Background execution
+    # -----------------------------
+    def _post(self, fn, *args):
+        # Safe from any thread: only the queue is touched here, never Tcl
+        self._posted.put((fn, args))
+
+    def _drain_posted(self):
+        # Scheduled before running anything so one failing call can't end the poll
+        self._posted_after_id = self.after(self._post_poll_ms, self._drain_posted)
+        while True:
+            try:
+                fn, args = self._posted.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
+
+    def _set_busy(self, busy):
+        self._busy = busy
+        self.run_btn.configure(state="disabled" if busy else "normal")
+
+    def _run_steps(self, steps, path):
+        # Worker thread: never touch widgets directly here, go through _post()
+        for label, cmd in steps:
+            self._post(self._append_output, label)
+            got_output = []
+
+            def on_line(line):
+                got_output.append(True)
+                self._post(self._append_output, line)
+
+            code = stream_cmd(cmd, path, on_line)
+            if not got_output:
+                self._post(self._append_output, "(no output)")
+            self._post(self._append_output, f"(exit {code})\n")
+            if code != 0:
+                return
 
 if __name__ == "__main__":
     app = GitHelperUI()
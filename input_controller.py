@@ -17,6 +17,15 @@ class InputController:
         self._space_down = False
         self._pan_active = False
 
+        # Only the latest drag position is applied, once per idle pass
+        self._last_pan_xy = (0, 0)
+        self._pan_job = None
+
+        # Wheel ticks are summed and applied once per idle pass
+        self._pending_wheel = 0.0
+        self._wheel_xy = (0, 0)
+        self._wheel_job = None
+
     def install(self):
         # Space gating (bind on app so it works even when canvas isn't focused)
         self.app.bind_all("<KeyPress-space>", self._on_space_down)
@@ -50,6 +59,7 @@ class InputController:
     def _on_space_up(self, _e=None):
         self._space_down = False
         self._pan_active = False
+        self._flush_pan()
         self.viewport.pan_end()
         try:
             self.canvas.configure(cursor="")
@@ -69,24 +79,59 @@ class InputController:
     def _on_pan_move(self, e):
         if not (self._space_down and self._pan_active):
             return
-        self.viewport.pan_move(e.x, e.y)
+        # Motion arrives at mouse polling rate; drop all but the newest position
+        self._last_pan_xy = (e.x, e.y)
+        if self._pan_job is None:
+            self._pan_job = self.canvas.after_idle(self._do_pan)
+
+    def _do_pan(self):
+        self._pan_job = None
+        self.viewport.pan_move(*self._last_pan_xy)
+
+    def _flush_pan(self):
+        # Apply a still-queued move before the drag ends so nothing is lost
+        if self._pan_job is None:
+            return
+        try:
+            self.canvas.after_cancel(self._pan_job)
+        except Exception:
+            pass
+        self._do_pan()
 
     def _on_pan_release(self, _e):
         self._pan_active = False
+        self._flush_pan()
         self.viewport.pan_end()
 
     # -----------------------------
     # Wheel zoom
     # -----------------------------
     def _on_linux_wheel_up(self, e):
-        self.viewport.wheel_zoom(e.x, e.y, delta=+1)
-        self.app.zoom_var.set(self.viewport.get_zoom())
+        self._queue_wheel(e.x, e.y, 120.0)
 
     def _on_linux_wheel_down(self, e):
-        self.viewport.wheel_zoom(e.x, e.y, delta=-1)
-        self.app.zoom_var.set(self.viewport.get_zoom())
+        self._queue_wheel(e.x, e.y, -120.0)
 
     def _on_mousewheel_zoom(self, e):
         # e.delta is typically +/-120 on Windows, small on macOS trackpads
-        self.viewport.wheel_zoom(e.x, e.y, delta=e.delta)
+        self._queue_wheel(e.x, e.y, e.delta)
+
+    def _queue_wheel(self, x, y, delta):
+        # Fast scrolling fires many events per frame; zoom once with their sum.
+        # Normalise +/-1 ticks to a notch first, as wheel_zoom does for a single
+        # one, so the zoom per tick doesn't depend on how many share a pass.
+        delta = float(delta)
+        if abs(delta) == 1.0:
+            delta *= 120.0
+        self._pending_wheel += delta
+        self._wheel_xy = (x, y)
+        if self._wheel_job is None:
+            self._wheel_job = self.app.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        self._wheel_job = None
+        delta, self._pending_wheel = self._pending_wheel, 0.0
+        if not delta:
+            return
+        self.viewport.wheel_zoom(*self._wheel_xy, delta=delta)
         self.app.zoom_var.set(self.viewport.get_zoom())
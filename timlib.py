@@ -1,11 +1,27 @@
 # timlib.py
 import os
+import sys
 import json
+import mmap
 import struct
-from dataclasses import dataclass
+from array import array
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Tuple
 
-from PIL import Image
+from PIL import Image, ImageChops
+
+try:
+    import numpy as np
+except ImportError:  # optional: fast paths are skipped without it
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: JIT render kernel, numpy gather is used without it
+    njit = None
 
 
 # -----------------------------
@@ -18,6 +34,17 @@ def u32(data: bytes, off: int) -> int:
 def u16(data: bytes, off: int) -> int:
     return struct.unpack_from("<H", data, off)[0]
 
+def u16_words(raw: bytes) -> array:
+    """
+    Little-endian uint16 words of raw as array('H'): one C-level copy, no
+    per-word Python ints (non-numpy counterpart of np.frombuffer(raw, "<u2")).
+    """
+    words = array("H")
+    words.frombytes(raw[: len(raw) & ~1])
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words
+
 def ps1_15bit_to_rgba(c: int) -> Tuple[int, int, int, int]:
     """
     PS1 TIM color: 0b0BBBBBGGGGGRRRRR (15-bit), bit15 often STP.
@@ -35,6 +62,19 @@ def ps1_15bit_to_rgba(c: int) -> Tuple[int, int, int, int]:
     return (r, g, b, a)
 
 
+def _ps1_words_to_rgba_np(words: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized ps1_15bit_to_rgba: uint16 words -> (..., 4) uint8 RGBA.
+    """
+    words = words.astype(np.uint16, copy=False)
+    out = np.empty(words.shape + (4,), dtype=np.uint8)
+    for ch, shift in enumerate((0, 5, 10)):
+        c5 = ((words >> shift) & 0x1F).astype(np.uint8)
+        out[..., ch] = (c5 << 3) | (c5 >> 2)
+    out[..., 3] = np.where((words & 0x7FFF) == 0, 0, 255)
+    return out
+
+
 # -----------------------------
 # Data structures
 # -----------------------------
@@ -43,22 +83,52 @@ def ps1_15bit_to_rgba(c: int) -> Tuple[int, int, int, int]:
 class TimClut:
     source_path: str
     clut_index: int
-    colors: List[Tuple[int, int, int, int]]
-    raw_15bit: List[int]
+    # (N, 4) uint8 RGBA ndarray when numpy is available, else a list of RGBA tuples
+    colors: "np.ndarray | List[Tuple[int, int, int, int]]" = field(compare=False)
+    # Matching uint16 ndarray / array('H') of the raw 15-bit words
+    raw_15bit: "np.ndarray | array" = field(compare=False)
     width: int
     height: int
     row: int
 
+    # (256, 4) uint8 render LUT, built on first use; CLUT rows are never edited in place
+    _lut: "Optional[np.ndarray]" = field(default=None, init=False, repr=False, compare=False)
+
+    def get_lut(self) -> "np.ndarray":
+        """
+        Render lookup table for indices 0..255 (numpy only): the CLUT colours,
+        padded with magenta for indices past the end of the row.
+        """
+        if self._lut is None:
+            plen = min(len(self.colors), 256)
+            lut = np.empty((256, 4), dtype=np.uint8)
+            lut[plen:] = (255, 0, 255, 255)
+            if plen:
+                lut[:plen] = np.asarray(self.colors, dtype=np.uint8).reshape(-1, 4)[:plen]
+            self._lut = lut
+        return self._lut
+
+    @property
+    def colors_list(self) -> List[Tuple[int, int, int, int]]:
+        # For consumers that want plain RGBA tuples regardless of storage
+        if np is not None and isinstance(self.colors, np.ndarray):
+            return [tuple(c) for c in self.colors.tolist()]
+        return list(self.colors)
+
     @property
     def label(self) -> str:
         base = os.path.basename(self.source_path)
         return f"{base} | CLUT #{self.clut_index} (row {self.row}, {self.width} cols)"
 
 
+# Pixels per 16-bit word, indexed by bpp mode: 4bpp, 8bpp, 16bpp, 24bpp
+# (24bpp is not implemented correctly here)
+_PIXELS_PER_WORD = (4, 2, 1, 2)
+
+
 @dataclass
 class TimImage:
     path: str
-    original_bytes: bytes          # original TIM bytes (for reference)
     flags: int                     # TIM flags word (bpp + hasClut bit)
     bpp_mode: int                  # 0=4bpp, 1=8bpp, 2=16bpp, 3=24bpp (not implemented)
     has_clut: bool
@@ -74,17 +144,22 @@ class TimImage:
 
     applied_clut: Optional[TimClut] = None
 
+    # Bumped whenever the pixel data is edited in place (invalidates cached renders)
+    version: int = field(default=0, compare=False)
+
+    @cached_property
+    def basename(self) -> str:
+        # path never changes after parse, so compute once (status bar hits this often)
+        return os.path.basename(self.path)
+
+    @cached_property
+    def stem(self) -> str:
+        return os.path.splitext(self.basename)[0]
+
     def pixel_width(self) -> int:
-        # TIM image width field is in 16-bit words.
-        if self.bpp_mode == 0:   # 4bpp: 1 word = 4 pixels
-            return self.img_w_words * 4
-        if self.bpp_mode == 1:   # 8bpp: 1 word = 2 pixels
-            return self.img_w_words * 2
-        if self.bpp_mode == 2:   # 16bpp: 1 word = 1 pixel
-            return self.img_w_words
-        if self.bpp_mode == 3:   # 24bpp: not implemented correctly here
-            return self.img_w_words * 2
-        return self.img_w_words
+        # TIM image width field is in 16-bit words; see _PIXELS_PER_WORD
+        bpp = self.bpp_mode
+        return self.img_w_words * (_PIXELS_PER_WORD[bpp] if 0 <= bpp < 4 else 1)
 
 
 # -----------------------------
@@ -92,9 +167,15 @@ class TimImage:
 # -----------------------------
 
 def parse_tim(path: str) -> TimImage:
+    # Map the file instead of reading it: only the CLUT and image blocks get
+    # copied out, so the whole file is never held in memory as one bytes.
     with open(path, "rb") as f:
-        data = f.read()
+        if os.fstat(f.fileno()).st_size < 8:
+            raise ValueError("File too small to be a TIM")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _parse_tim_buffer(path, data)
 
+def _parse_tim_buffer(path: str, data) -> TimImage:
     if len(data) < 8:
         raise ValueError("File too small to be a TIM")
 
@@ -138,7 +219,6 @@ def parse_tim(path: str) -> TimImage:
 
     return TimImage(
         path=path,
-        original_bytes=data,
         flags=flags,
         bpp_mode=bpp_mode,
         has_clut=has_clut,
@@ -171,7 +251,10 @@ def extract_cluts_from_raw_block(tim: TimImage) -> List[TimClut]:
     if len(raw) % 2 != 0:
         raw = raw[:-1]
 
-    words = list(struct.unpack("<" + "H" * (len(raw)//2), raw))
+    if np is not None:
+        words = np.frombuffer(raw, dtype="<u2")
+    else:
+        words = u16_words(raw)
 
     w = clut_w
     h = clut_h
@@ -181,12 +264,20 @@ def extract_cluts_from_raw_block(tim: TimImage) -> List[TimClut]:
     if len(words) < w * h:
         h = max(1, len(words) // w)
 
+    # Expand every CLUT entry in one vectorized pass; rows are views into it
+    all_rgba = None
+    if np is not None:
+        all_rgba = _ps1_words_to_rgba_np(words[: w * h])
+
     cluts: List[TimClut] = []
     idx = 0
     for row in range(h):
         row_words = words[idx: idx + w]
+        if all_rgba is not None:
+            rgba = all_rgba[idx: idx + w]
+        else:
+            rgba = [ps1_15bit_to_rgba(c) for c in row_words]
         idx += w
-        rgba = [ps1_15bit_to_rgba(c) for c in row_words]
         cluts.append(
             TimClut(
                 source_path=tim.path,
@@ -205,21 +296,46 @@ def extract_cluts_from_raw_block(tim: TimImage) -> List[TimClut]:
 # Decode / render
 # -----------------------------
 
-def decode_indices(tim: TimImage) -> List[int]:
+_LO_NIBBLE = bytes(i & 0x0F for i in range(256))
+_HI_NIBBLE = bytes(i >> 4 for i in range(256))
+_NIBBLE_VALUES = bytes(range(16))
+
+def decode_indices(tim: TimImage) -> "np.ndarray | List[int]":
+    """
+    Per-pixel palette indices, row-major, zero-padded if img_data is short.
+    Returns a flat uint8 ndarray when numpy is available, else a list of ints.
+    """
     mode = tim.bpp_mode
     wpx = tim.pixel_width()
     hpx = tim.img_h
 
+    if np is not None and mode in (0, 1):
+        need = wpx * hpx
+        out = np.zeros(need, dtype=np.uint8)
+        if mode == 0:
+            # low nibble is the left pixel
+            b = np.frombuffer(tim.img_data, dtype=np.uint8, count=min(len(tim.img_data), (need + 1) // 2))
+            nib = np.empty(b.size * 2, dtype=np.uint8)
+            nib[0::2] = b & 0x0F
+            nib[1::2] = b >> 4
+            n = min(need, nib.size)
+            out[:n] = nib[:n]
+        else:
+            n = min(need, len(tim.img_data))
+            out[:n] = np.frombuffer(tim.img_data, dtype=np.uint8, count=n)
+        return out
+
     if mode == 0:
-        out: List[int] = [0] * (wpx * hpx)
-        o = 0
-        for b in tim.img_data:
-            if o >= len(out): break
-            out[o] = b & 0x0F
-            o += 1
-            if o >= len(out): break
-            out[o] = (b >> 4) & 0x0F
-            o += 1
+        # Split nibbles for the whole buffer at once (two table lookups in C),
+        # then interleave them with strided slice assignment.
+        need = wpx * hpx
+        src = bytes(tim.img_data[:(need + 1) // 2])
+        nib = bytearray(len(src) * 2)
+        nib[0::2] = src.translate(_LO_NIBBLE)
+        nib[1::2] = src.translate(_HI_NIBBLE)
+        out: List[int] = list(nib[:need])
+        if len(out) < need:
+            out.extend([0] * (need - len(out)))
         return out
 
     if mode == 1:
@@ -230,6 +346,56 @@ def decode_indices(tim: TimImage) -> List[int]:
 
     raise ValueError("decode_indices called for non-indexed TIM")
 
+def _image_from_rgba(data, wpx: int, hpx: int) -> Image.Image:
+    """
+    Wrap a packed RGBA buffer (bytes/bytearray/ndarray) as a PIL image without
+    copying.
+    """
+    return Image.frombuffer("RGBA", (wpx, hpx), data, "raw", "RGBA", 0, 1)
+
+if njit is not None and np is not None:
+    @njit(cache=True, parallel=True)
+    def _render_indexed_nb(idx, lut, out):
+        # idx: (n,) uint8, lut: (256, 4) uint8, out: (n, 4) uint8
+        for i in prange(idx.shape[0]):
+            c = idx[i]
+            out[i, 0] = lut[c, 0]
+            out[i, 1] = lut[c, 1]
+            out[i, 2] = lut[c, 2]
+            out[i, 3] = lut[c, 3]
+else:
+    _render_indexed_nb = None
+
+def _expand5_table(get5) -> List[int]:
+    # 256-entry point() table: byte -> 5-bit field widened to 8 bits
+    return [(c << 3) | (c >> 2) for c in (get5(b) & 0x1F for b in range(256))]
+
+_R5_TABLE = _expand5_table(lambda b: b)         # low byte bits 0..4 (also the reassembled G)
+_B5_TABLE = _expand5_table(lambda b: b >> 2)    # high byte bits 2..6
+_G_LO = bytes(b >> 5 for b in range(256))       # low byte bits 5..7 -> G bits 0..2
+_G_HI = bytes((b & 0x03) << 3 for b in range(256))  # high byte bits 0..1 -> G bits 3..4
+_HI_NO_STP = bytes(b & 0x7F for b in range(256))
+_ALPHA_TABLE = [0] + [255] * 255
+
+def _render_16bpp_pil(data: bytes, wpx: int, hpx: int, expected_words: int) -> Image.Image:
+    """
+    Non-numpy ps1_15bit_to_rgba over a whole 16bpp payload: split low/high
+    bytes, rebuild each channel with table lookups, merge once in PIL.
+    """
+    n = min(expected_words, len(data) // 2, wpx * hpx)
+    # Missing pixels are zero words, which decode to (0, 0, 0, 0)
+    raw = bytes(data[: 2 * n]) + bytes(2 * (wpx * hpx - n))
+    lo, hi = raw[0::2], raw[1::2]
+
+    def plane(b: bytes) -> Image.Image:
+        return Image.frombuffer("L", (wpx, hpx), b, "raw", "L", 0, 1)
+
+    r = plane(lo).point(_R5_TABLE)
+    b = plane(hi).point(_B5_TABLE)
+    g = ImageChops.add(plane(lo.translate(_G_LO)), plane(hi.translate(_G_HI))).point(_R5_TABLE)
+    a = ImageChops.lighter(plane(lo), plane(hi.translate(_HI_NO_STP))).point(_ALPHA_TABLE)
+    return Image.merge("RGBA", (r, g, b, a))
+
 def render_tim_to_image(tim: TimImage, clut: Optional[TimClut]) -> Image.Image:
     mode = tim.bpp_mode
     wpx = tim.pixel_width()
@@ -237,46 +403,72 @@ def render_tim_to_image(tim: TimImage, clut: Optional[TimClut]) -> Image.Image:
 
     if mode == 2:
         expected_words = tim.img_w_words * tim.img_h
-        raw = tim.img_data[: (len(tim.img_data)//2)*2]
-        words = struct.unpack("<" + "H" * (len(raw)//2), raw)
-        words = words[:expected_words]
-
-        out = Image.new("RGBA", (wpx, hpx))
-        px = out.load()
-        i = 0
-        for y in range(hpx):
-            for x in range(wpx):
-                px[x, y] = ps1_15bit_to_rgba(words[i]) if i < len(words) else (0, 0, 0, 0)
-                i += 1
-        return out
+
+        if np is not None:
+            n = min(expected_words, len(tim.img_data) // 2)
+            words = np.frombuffer(tim.img_data, dtype="<u2", count=n)
+            rgba = np.zeros((wpx * hpx, 4), dtype=np.uint8)  # missing pixels stay (0, 0, 0, 0)
+            rgba[:n] = _ps1_words_to_rgba_np(words)
+            return _image_from_rgba(rgba, wpx, hpx)
+
+        return _render_16bpp_pil(tim.img_data, wpx, hpx, expected_words)
 
     if mode in (0, 1):
         indices = decode_indices(tim)
 
         if clut is None:
-            out = Image.new("RGBA", (wpx, hpx))
-            px = out.load()
-            for y in range(hpx):
-                base = y * wpx
-                for x in range(wpx):
-                    v = indices[base + x] & 0xFF
-                    px[x, y] = (v, v, v, 255)
-            return out
-
-        palette = clut.colors
-        plen = len(palette)
-        out = Image.new("RGBA", (wpx, hpx))
-        px = out.load()
-        for y in range(hpx):
-            base = y * wpx
-            for x in range(wpx):
-                idx = indices[base + x]
-                px[x, y] = palette[idx] if idx < plen else (255, 0, 255, 255)
-        return out
+            if np is not None:
+                # Broadcast the index into R, G and B; alpha is always opaque
+                rgba = np.empty((wpx * hpx, 4), dtype=np.uint8)
+                rgba[:, :3] = np.asarray(indices, dtype=np.uint8)[:, None]
+                rgba[:, 3] = 255
+                return _image_from_rgba(rgba, wpx, hpx)
+            # L -> RGBA is exactly (v, v, v, 255)
+            return Image.frombuffer("L", (wpx, hpx), bytes(indices), "raw", "L", 0, 1).convert("RGBA")
+
+        if np is not None:
+            # One C-level gather through the CLUT's cached LUT
+            lut = clut.get_lut()
+            idx_arr = np.asarray(indices, dtype=np.uint8)
+            if _render_indexed_nb is not None:
+                rgba = np.empty((idx_arr.size, 4), dtype=np.uint8)
+                _render_indexed_nb(idx_arr, lut, rgba)
+                return _image_from_rgba(rgba, wpx, hpx)
+            return _image_from_rgba(lut[idx_arr], wpx, hpx)
+
+        # Let PIL apply the CLUT as an RGBA palette; out-of-range indices map to magenta
+        colors = clut.colors_list[:256]
+        pal = b"".join(bytes(c) for c in colors) + bytes((255, 0, 255, 255)) * (256 - len(colors))
+        im = Image.frombuffer("P", (wpx, hpx), bytes(indices), "raw", "P", 0, 1)
+        im.putpalette(pal, "RGBA")
+        return im.convert("RGBA")
 
     raise NotImplementedError(f"TIM bpp mode {mode} not supported in this tool.")
 
 
+# (id(tim), id(clut)) -> (tim, clut, tim.version, image); least recently used first
+_RENDER_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_RENDER_CACHE_MAX = 8
+
+def render_tim_to_image_cached(tim: TimImage, clut: Optional[TimClut]) -> Image.Image:
+    """
+    Memoized render_tim_to_image. Entries hold their TIM/CLUT so a reused id()
+    can't alias, and are dropped when tim.version changes. Callers must treat
+    the returned image as read-only (it is shared).
+    """
+    key = (id(tim), id(clut))
+    hit = _RENDER_CACHE.get(key)
+    if hit is not None and hit[0] is tim and hit[1] is clut and hit[2] == tim.version:
+        _RENDER_CACHE.move_to_end(key)
+        return hit[3]
+
+    im = render_tim_to_image(tim, clut)
+    _RENDER_CACHE[key] = (tim, clut, tim.version, im)
+    while len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+        _RENDER_CACHE.popitem(last=False)
+    return im
+
+
 # -----------------------------
 # Animation helpers
 # -----------------------------
@@ -303,6 +495,9 @@ def slice_frames_fixed(sheet: Image.Image, frame_w: int, frame_h: int, direction
     if frame_w <= 0 or frame_h <= 0:
         return [sheet]
 
+    if np is not None and sheet.mode == "RGBA":
+        return _slice_frames_np(sheet, frame_w, frame_h, direction)
+
     sw, sh = sheet.size
     frames: List[Image.Image] = []
 
@@ -323,20 +518,76 @@ def slice_frames_fixed(sheet: Image.Image, frame_w: int, frame_h: int, direction
 
     return frames if frames else [sheet]
 
+def _slice_frames_np(sheet: Image.Image, frame_w: int, frame_h: int, direction: str) -> List[Image.Image]:
+    """
+    slice_frames_fixed for RGBA sheets via one array: the sheet is laid out
+    zero-padded into a (count, frame_h, frame_w, 4) block and each frame wraps
+    a slice of it.
+    """
+    arr = np.asarray(sheet)
+    sh, sw = arr.shape[:2]
+
+    if direction == "vertical":
+        count = max(1, sh // frame_h)
+        block = np.zeros((count * frame_h, frame_w, 4), dtype=np.uint8)
+    else:
+        count = max(1, sw // frame_w)
+        block = np.zeros((frame_h, count * frame_w, 4), dtype=np.uint8)
+
+    ch, cw = min(sh, block.shape[0]), min(sw, block.shape[1])
+    block[:ch, :cw] = arr[:ch, :cw]
+
+    if direction == "vertical":
+        frames_arr = block.reshape(count, frame_h, frame_w, 4)
+    else:
+        frames_arr = np.ascontiguousarray(
+            block.reshape(frame_h, count, frame_w, 4).transpose(1, 0, 2, 3)
+        )
+    return [_image_from_rgba(f, frame_w, frame_h) for f in frames_arr]
+
 
 # -----------------------------
 # Index export/import (resizable)
 # -----------------------------
 
-def make_grayscale_palette(num_entries: int) -> List[int]:
-    pal = []
-    for i in range(256):
-        if i < num_entries:
-            v = int(round(i * 255 / (num_entries - 1))) if num_entries > 1 else 0
-            pal.extend([v, v, v])
-        else:
-            pal.extend([0, 0, 0])
-    return pal
+def make_grayscale_palette(num_entries: int) -> bytes:
+    """768-byte RGB palette: a grey ramp over num_entries, black after."""
+    n = max(0, min(num_entries, 256))
+    if np is not None:
+        pal = np.zeros((256, 3), dtype=np.uint8)
+        if n > 1:
+            pal[:n] = np.round(np.linspace(0, 255, n)).astype(np.uint8)[:, None]
+        return pal.tobytes()
+
+    vals = [int(round(i * 255 / (n - 1))) if n > 1 else 0 for i in range(n)]
+    return bytes(v for v in vals for _ in range(3)) + bytes(3 * (256 - n))
+
+# Same 1 MiB output buffer as actions._write_file_buffered: the small
+# header chunks and the IDAT payload go out in a few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+def _png_chunk(tag: bytes, payload: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(payload)) + tag + payload
+        + struct.pack(">I", zlib.crc32(payload, zlib.crc32(tag)) & 0xFFFFFFFF)
+    )
+
+def write_indexed_png(path: str, idx: "np.ndarray", palette: bytes) -> None:
+    """
+    Minimal 8-bit palette PNG writer for an (h, w) uint8 index array.
+    Every row uses filter 0, so this is a single zlib pass with no palette
+    rebuild (what PIL would do for mode P + optimize=False).
+    """
+    h, w = idx.shape
+    rows = np.zeros((h, w + 1), dtype=np.uint8)
+    rows[:, 1:] = idx
+
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 3, 0, 0, 0)))
+        f.write(_png_chunk(b"PLTE", bytes(palette)))
+        f.write(_png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(_png_chunk(b"IEND", b""))
 
 def export_indices_png_and_meta(tim: TimImage, out_png_path: str) -> str:
     if tim.bpp_mode not in (0, 1):
@@ -346,14 +597,17 @@ def export_indices_png_and_meta(tim: TimImage, out_png_path: str) -> str:
     h = tim.img_h
     indices = decode_indices(tim)
 
-    img = Image.new("P", (w, h))
-    img.putdata([i & 0xFF for i in indices])
-
     num_entries = 16 if tim.bpp_mode == 0 else 256
-    img.putpalette(make_grayscale_palette(num_entries))
+    palette = make_grayscale_palette(num_entries)
 
     os.makedirs(os.path.dirname(out_png_path) or ".", exist_ok=True)
-    img.save(out_png_path, "PNG", optimize=False)
+    if np is not None and w > 0 and h > 0:
+        idx = np.asarray(indices, dtype=np.uint8).reshape(h, w)
+        write_indexed_png(out_png_path, idx, palette)
+    else:
+        img = Image.frombuffer("P", (w, h), bytes(indices), "raw", "P", 0, 1)
+        img.putpalette(palette)
+        img.save(out_png_path, "PNG", optimize=False)
 
     meta = {
         "format": "tim_index_edit_v2",
@@ -386,11 +640,27 @@ def words_for_width_pixels(bpp_mode: int, width_px: int) -> int:
         return width_px
     raise ValueError("Unsupported bpp for resizing")
 
-def pack_indices_for_size(indices: List[int], bpp_mode: int, width_px: int, height_px: int) -> bytes:
+def pack_indices_for_size(indices: "np.ndarray | bytes | List[int]", bpp_mode: int, width_px: int, height_px: int) -> bytes:
     expected = width_px * height_px
     if len(indices) != expected:
         raise ValueError(f"Index pixel count mismatch: expected {expected}, got {len(indices)}")
 
+    if np is not None and bpp_mode in (0, 1):
+        if isinstance(indices, (bytes, bytearray)):
+            # asarray() would make a 0-d |S array of the whole buffer
+            a = np.frombuffer(indices, dtype=np.uint8)
+        else:
+            a = np.asarray(indices)
+        if a.dtype != np.uint8:
+            a = (a.astype(np.int64) & 0xFF).astype(np.uint8)
+        if bpp_mode == 1:
+            return a.tobytes()
+        a = a & 0x0F
+        if a.size & 1:
+            a = np.concatenate([a, np.zeros(1, dtype=np.uint8)])
+        # low nibble is the left pixel
+        return (a[0::2] | (a[1::2] << 4)).tobytes()
+
     if bpp_mode == 1:
         return bytes((v & 0xFF) for v in indices)
 
@@ -424,27 +694,36 @@ def import_indices_from_png_resize_tim(tim: TimImage, png_path: str, meta_path:
         )
 
     new_w, new_h = img.size
-    indices = list(img.getdata())
+    # Mode P stores one index byte per pixel, so the raw image bytes are the indices
+    raw = img.tobytes()
+    indices = np.frombuffer(raw, dtype=np.uint8) if np is not None else raw
 
-    if tim.bpp_mode == 0 and any(v > 15 for v in indices):
-        raise ValueError("4bpp import: found indices > 15. Keep indices in 0..15.")
+    if tim.bpp_mode == 0:
+        if np is not None:
+            too_big = bool((indices > 15).any())
+        else:
+            too_big = bool(raw.translate(None, _NIBBLE_VALUES))  # anything left is > 15
+        if too_big:
+            raise ValueError("4bpp import: found indices > 15. Keep indices in 0..15.")
 
     tim.img_w_words = words_for_width_pixels(tim.bpp_mode, new_w)
     tim.img_h = new_h
     tim.img_data = pack_indices_for_size(indices, tim.bpp_mode, new_w, new_h)
+    tim.version += 1
 
-def build_tim_bytes(tim: TimImage) -> bytes:
-    out = bytearray()
-    out += struct.pack("<I", 0x10)
-    out += struct.pack("<I", tim.flags)
+def tim_sections(tim: TimImage) -> List[bytes]:
+    """
+    TIM file contents as an ordered list of chunks (header, CLUT block, image
+    block header, image data). Payloads are referenced, not copied.
+    """
+    parts = [struct.pack("<II", 0x10, tim.flags)]
 
     if tim.has_clut:
         if not tim.clut_block_raw:
             raise ValueError("TIM claims to have CLUT but clut_block_raw is missing.")
-        out += tim.clut_block_raw
+        parts.append(tim.clut_block_raw)
 
     img_block_len = 12 + len(tim.img_data)
-    out += struct.pack("<I", img_block_len)
-    out += struct.pack("<HHHH", tim.img_x, tim.img_y, tim.img_w_words, tim.img_h)
-    out += tim.img_data
-    return bytes(out)
+    parts.append(struct.pack("<IHHHH", img_block_len, tim.img_x, tim.img_y, tim.img_w_words, tim.img_h))
+    parts.append(tim.img_data)
+    return parts
@@ -57,6 +57,11 @@ def build_ui(app):
     app.info_var = tk.StringVar(value="Load TIMs to begin.")
     ttk.Label(sidebar, textvariable=app.info_var, wraplength=320).grid(row=3, column=0, sticky="ew", pady=(8, 0))
 
+    # Shown only while load_tims is parsing in the background
+    app.load_progress = ttk.Progressbar(sidebar, mode="determinate")
+    app.load_progress.grid(row=4, column=0, sticky="ew", pady=(6, 0))
+    app.load_progress.grid_remove()
+
     # Zoom bar
     topbar = ttk.Frame(main)
     topbar.grid(row=0, column=0, sticky="ew")
@@ -1,17 +1,150 @@
 # viewport.py
 import time
 import math
+import queue
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, NamedTuple
 
 from PIL import Image, ImageTk
 
+try:
+    from numba import njit
+except ImportError:  # optional: geometry helper runs as plain Python without it
+    njit = None
+
+
+# Freed blocks (16 MiB each by default) Pillow's arena should keep, so the
+# per-frame tile/preview images reuse memory instead of going back to the OS
+_PIL_BLOCKS_MAX = 4
+
+
+def _raise_pil_blocks_max(n: int) -> None:
+    """Raise Pillow's process-wide freed-block cache to at least n blocks."""
+    if hasattr(Image.core, "set_blocks_max") and Image.core.get_blocks_max() < n:
+        Image.core.set_blocks_max(n)
+
+
+# Matches the canvas bg "#202020"
+_PREVIEW_BG_RGB = (0x20, 0x20, 0x20)
+
+
+# Zoom limits, and the smallest change that counts as a new zoom
+_ZOOM_MIN, _ZOOM_MAX, _ZOOM_EPS = 0.5, 16.0, 1e-9
+
+
+def _clamp_zoom(z: float, old: float) -> Tuple[float, bool]:
+    """z clamped to the zoom range, and whether it differs from old."""
+    z = _ZOOM_MIN if z < _ZOOM_MIN else (_ZOOM_MAX if z > _ZOOM_MAX else z)
+    return z, abs(z - old) >= _ZOOM_EPS
+
 
 def _now_ms() -> float:
     return time.perf_counter() * 1000.0
 
 
+def _view_rect_py(z, cw, ch, pad, left_w0, top_w0, iw, ih):
+    """
+    Viewport rect in image coords for view origin (left_w0, top_w0):
+    (l0, t0, r0, b0) unclipped, then the same rect clipped to the image.
+    """
+    l0 = (left_w0 - pad) / z
+    t0 = (top_w0 - pad) / z
+    r0 = l0 + cw / z
+    b0 = t0 + ch / z
+    return (
+        l0, t0, r0, b0,
+        max(0.0, min(iw, l0)), max(0.0, min(ih, t0)),
+        max(0.0, min(iw, r0)), max(0.0, min(ih, b0)),
+    )
+
+
+def _tile_geom_py(left_w0, top_w0, cw, ch, margin, img_x, img_y, z,
+                  pil_w, pil_h, quant_img, lvl_scale, lvl_w, lvl_h):
+    """
+    SHARP tile for view origin (left_w0, top_w0) grown by margin screen px:
+    (ok, crop_l, crop_t, crop_r, crop_b, l2, t2, r2, b2, target_w, target_h),
+    with the crop in image px quantized to quant_img, (l2..b2) the same rect in
+    pyramid-level px and target_* its on-screen size. ok is 0 if the rect
+    misses the image.
+    """
+    l_ix = max(0.0, min(pil_w, (left_w0 - margin - img_x) / z))
+    r_ix = max(0.0, min(pil_w, (left_w0 + cw + margin - img_x) / z))
+    t_iy = max(0.0, min(pil_h, (top_w0 - margin - img_y) / z))
+    b_iy = max(0.0, min(pil_h, (top_w0 + ch + margin - img_y) / z))
+    if r_ix <= l_ix or b_iy <= t_iy:
+        return 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+
+    crop_l = int(l_ix)
+    crop_t = int(t_iy)
+    crop_r = int(r_ix + 0.999)
+    crop_b = int(b_iy + 0.999)
+
+    # Quantize BOTH sides for stability
+    if quant_img > 1:
+        crop_l = (crop_l // quant_img) * quant_img
+        crop_t = (crop_t // quant_img) * quant_img
+        crop_r = ((crop_r + quant_img - 1) // quant_img) * quant_img
+        crop_b = ((crop_b + quant_img - 1) // quant_img) * quant_img
+
+    crop_r = max(crop_l + 1, min(int(pil_w), crop_r))
+    crop_b = max(crop_t + 1, min(int(pil_h), crop_b))
+
+    l2 = int(crop_l * lvl_scale)
+    t2 = int(crop_t * lvl_scale)
+    # math.ceil on purpose: int() truncates toward zero, so -int(-x) would floor fractions
+    r2 = min(lvl_w, max(l2 + 1, int(math.ceil(crop_r * lvl_scale))))
+    b2 = min(lvl_h, max(t2 + 1, int(math.ceil(crop_b * lvl_scale))))
+
+    # Target size in screen px
+    target_w = max(1, int((crop_r - crop_l) * z))
+    target_h = max(1, int((crop_b - crop_t) * z))
+    return 1, crop_l, crop_t, crop_r, crop_b, l2, t2, r2, b2, target_w, target_h
+
+
+# JIT-compiled when numba is around (called on every drag tick)
+if njit is not None:
+    _view_rect = njit(cache=True)(_view_rect_py)
+    _tile_geom = njit(cache=True)(_tile_geom_py)
+else:
+    _view_rect = _view_rect_py
+    _tile_geom = _tile_geom_py
+
+
+def _identity_scale(src_wh: Tuple[int, int], dst_wh: Tuple[int, int], tol: int = 0) -> bool:
+    """True if resampling src_wh to dst_wh would be (within tol px) a no-op."""
+    return abs(src_wh[0] - dst_wh[0]) <= tol and abs(src_wh[1] - dst_wh[1]) <= tol
+
+
+def _reduce_factor(src_wh: Tuple[int, int], dst_wh: Tuple[int, int]) -> int:
+    """k if src_wh is (within 1%) an integer k > 1 times dst_wh on both axes, else 0."""
+    src_w, src_h = src_wh
+    k = int(round(src_w / dst_wh[0]))
+    if k > 1 and abs(src_w - k * dst_wh[0]) <= 0.01 * src_w and abs(src_h - k * dst_wh[1]) <= 0.01 * src_h:
+        return k
+    return 0
+
+
+def _downscale_uses_filter(src_wh: Tuple[int, int], dst_wh: Tuple[int, int]) -> bool:
+    """False when a downscale needs no resample filter (plain crop or exact reduce())."""
+    if _identity_scale(src_wh, dst_wh):
+        return False
+    k = _reduce_factor(src_wh, dst_wh)
+    return not (k and (-(-src_wh[0] // k), -(-src_wh[1] // k)) == tuple(dst_wh))
+
+
+class Geom(NamedTuple):
+    """Canvas size, scroll pad, image origin in world coords and zoom, read together."""
+    cw: int
+    ch: int
+    pad: int
+    img_x: int
+    img_y: int
+    zoom: float
+
+
 class ViewportCanvas(ttk.Frame):
     """
     Smooth pan/zoom viewport with a 2-layer drag system:
@@ -25,6 +158,8 @@ class ViewportCanvas(ttk.Frame):
 
     def __init__(self, parent):
         super().__init__(parent)
+        # Process-wide Pillow setting, applied here rather than on import
+        _raise_pil_blocks_max(_PIL_BLOCKS_MAX)
         self.rowconfigure(0, weight=1)
         self.columnconfigure(0, weight=1)
 
@@ -44,6 +179,17 @@ class ViewportCanvas(ttk.Frame):
 
         # Pyramid levels: (scale_relative_to_original, image)
         self._pyr: List[Tuple[float, Image.Image]] = []
+        # log2(scale) per level, kept in step with _pyr by _set_pyramid()
+        self._pyr_log2: List[float] = []
+        # (zoom, bias) -> chosen level index; wheel zoom revisits the same few zooms
+        self._pyr_pick_memo = {}
+        # Downsampled levels are built here (Pillow drops the GIL while resizing)
+        self._pyr_pool = ThreadPoolExecutor(max_workers=1)
+        # Calls from worker threads, run on the Tk loop by _drain_posted()
+        self._posted: "queue.Queue[tuple]" = queue.Queue()
+        self._post_poll_ms = 15
+        self._posted_after_id: Optional[str] = None
+        self._drain_posted()
 
         # -------------------------
         # Canvas image items
@@ -52,15 +198,51 @@ class ViewportCanvas(ttk.Frame):
         self._preview_id: Optional[int] = None
         self._preview_tk: Optional[ImageTk.PhotoImage] = None
         self._preview_visible = False
+        # Canvas-sized RGB backing image reused across preview frames
+        self._preview_bg: Optional[Image.Image] = None
+        # Stacking of the two items only changes when one of them is created
+        self._sharp_above_preview = False
 
         # SHARP layer (world anchored)
         self._canvas_image_id: Optional[int] = None
         self._tk_image: Optional[ImageTk.PhotoImage] = None
+        # (mode, size) of _tk_image when this widget created it and may paste into it;
+        # None for photos handed in from outside (set_prescaled_image)
+        self._tk_image_owned: Optional[Tuple[str, Tuple[int, int]]] = None
+        # (photo, x, y) last applied to the SHARP item
+        self._sharp_shown: Optional[Tuple[ImageTk.PhotoImage, int, int]] = None
+        # draw_key -> (source image, PhotoImage, (mode, size)) for settled (non-drag) tiles
+        self._tk_tile_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._tk_tile_cache_max = 4
 
         # Interaction state
         self._is_dragging = False
         self._user_panned = False
 
+        # pan_move applies the pointer at once unless the last flush was under
+        # _pan_flush_ms ago; then one deferred flush applies the latest position
+        self._pan_flush_ms = 16  # ~60 Hz
+        self._pan_pending = False
+        self._pan_last_flush_ms = 0.0
+        self._pan_last_xy: Optional[Tuple[int, int]] = None
+        self._pan_after_id = None
+        # scan_mark pointer and the view origin at that moment; scan_dragto moves the
+        # origin by exactly the pointer delta, so pan flushes can compute it locally
+        self._pan_mark: Optional[Tuple[int, int]] = None
+        self._pan_origin: Optional[Tuple[int, int]] = None
+
+        # Canvas size as last reported by <Configure> (requested size until mapped),
+        # so geometry reads never need a winfo round-trip
+        self._cw = max(1, self.canvas.winfo_reqwidth())
+        self._ch = max(1, self.canvas.winfo_reqheight())
+        # View origin read once per pan flush (dropped whenever something else moves the view)
+        self._origin_cache: Optional[Tuple[float, float]] = None
+
+        # Scrollbar updates from xscrollcommand/yscrollcommand, applied once per idle
+        self._sb_pending = False
+        self._sb_x: Optional[Tuple[str, str]] = None
+        self._sb_y: Optional[Tuple[str, str]] = None
+
         # Scheduling (sharp)
         self._view_after_id = None
         self._force_next_draw = False
@@ -78,6 +260,9 @@ class ViewportCanvas(ttk.Frame):
 
         # Space around image in scrollregion
         self._pad_mode = "auto"  # "auto" or int pixels
+        # Last scrollregion handed to Tk, and the (w, h, zoom, pad) it came from
+        self._scrollregion_last: Optional[Tuple[int, int, int, int]] = None
+        self._scroll_memo: Optional[Tuple[tuple, Tuple[int, int]]] = None
 
         # -------------------------
         # Base tuning (screen space)
@@ -130,7 +315,8 @@ class ViewportCanvas(ttk.Frame):
 
         # push preview to smaller pyramid levels
         self._preview_bias_down_extra = 0.95
-        self._preview_resample = Image.BILINEAR
+        # The proxy only exists while dragging, so use the filterless resample
+        self._preview_resample = Image.NEAREST
 
         # -------------------------
         # Non-freeze drag throttle (fallback)
@@ -139,15 +325,33 @@ class ViewportCanvas(ttk.Frame):
         self._drag_min_interval_ms_high_zoom = 55
         self._drag_outside_tile_min_interval_ms_high_zoom = 70
         self._drag_last_redraw_ms = 0.0
+        # (zoom, (drag_min, drag_min_outside_tile, escape_min)); zoom is fixed during a drag
+        self._drag_min_memo: Optional[Tuple[float, Tuple[float, float, float]]] = None
 
         # -------------------------
         # Pyramid settings
         # -------------------------
         self._pyr_min_dim = 256
         self._pyr_levels = 5
-        self._pyr_downsample_resample = Image.BILINEAR
+        # Past the _ZOOM_MIN level, at most one level under half the smaller canvas
+        # side is built; the pyramid is rebuilt when the canvas moves that floor
+        # by more than this factor
+        self._pyr_rebuild_ratio = 1.5
+        self._pyr_built_floor: Optional[int] = None
+        # Downscales use the cheaper filter while zoom input is arriving and the
+        # better one once it has been quiet for _zoom_settle_ms
         self._downscale_resample = Image.BILINEAR
+        self._settled_downscale_resample = Image.LANCZOS
         self._upscale_resample = Image.NEAREST
+        self._zoom_settle_ms = 150
+        self._zoom_settle_after_id = None
+        self._active_downscale = self._settled_downscale_resample
+        self._last_tile_downscaled = False
+        # The settled-filter upgrade of a large tile is resampled on _pyr_pool while
+        # the interim tile (same rect) stays up; _pending_tile_key names the job in flight
+        self._async_tile_px = 512 * 512
+        self._settle_async = False
+        self._pending_tile_key = None
         self._pyr_bias_down = 0.55  # try 0.8 if wheel zoom spikes a lot
 
         # bindings
@@ -157,19 +361,48 @@ class ViewportCanvas(ttk.Frame):
     # Public API
     # -----------------------------
     def set_image(self, pil, *, recenter=True, force=True):
+        if pil is not self._pil:
+            self._tk_tile_cache.clear()
         self._pil = pil
-        self._build_pyramid(pil)
+        # Draw from the base image right away; smaller levels arrive via _install_pyramid
+        self._set_pyramid([(1.0, pil)] if pil is not None else [])
+        self._submit_pyramid_build()
         if recenter:
             self._user_panned = False
         self.invalidate_cache()
         self.schedule_redraw(0, force=force)
 
+    def destroy(self):
+        self._pyr_pool.shutdown(wait=False, cancel_futures=True)
+        if self._posted_after_id is not None:
+            try:
+                self.after_cancel(self._posted_after_id)
+            except Exception:
+                pass
+            self._posted_after_id = None
+        super().destroy()
+
+    def _post(self, fn, *args):
+        # Worker side of the hand-off: _pyr_pool jobs queue their install here
+        # and _drain_posted applies it on the Tk thread (see TimViewerApp._post)
+        self._posted.put((fn, args))
+
+    def _drain_posted(self):
+        self._posted_after_id = self.after(self._post_poll_ms, self._drain_posted)
+        while True:
+            try:
+                fn, args = self._posted.get_nowait()
+            except queue.Empty:
+                return
+            fn(*args)
+
     def set_zoom(self, z: float, *, recenter=False, force=False):
-        z = float(z or 1.0)
-        z = max(0.5, min(16.0, z))
-        if abs(z - self._zoom) < 1e-9 and not force:
+        z, changed = _clamp_zoom(float(z or 1.0), self._zoom)
+        if not changed and not force:
             return
         self._zoom = z
+        self._origin_cache = None  # new scrollregion may clamp the view
+        self._note_zoom_input()
         if recenter:
             self._user_panned = False
         self.invalidate_cache()
@@ -178,18 +411,63 @@ class ViewportCanvas(ttk.Frame):
     def get_zoom(self) -> float:
         return float(self._zoom)
 
+    def make_prescaled_photo(self, pil) -> ImageTk.PhotoImage:
+        """
+        Whole-image PhotoImage at the current zoom, for set_prescaled_image().
+        Uses the same resample choice as a settled SHARP redraw (these photos are
+        cached, so they never take the interactive filter).
+        """
+        z = float(self._zoom or 1.0)
+        w = max(1, int(pil.width * z))
+        h = max(1, int(pil.height * z))
+        resample = self._settled_downscale_resample if z < 1.0 else self._upscale_resample
+        return ImageTk.PhotoImage(pil.resize((w, h), resample=resample))
+
+    def set_prescaled_image(self, pil, photo) -> bool:
+        """
+        Animation fast path: show pil via a PhotoImage from make_prescaled_photo()
+        without re-cropping/resizing. Only valid when pil has the same size as the
+        currently shown image and photo was made at the current zoom.
+
+        Returns False (doing nothing) when the fast path doesn't apply; the caller
+        should fall back to set_image().
+        """
+        cur = self._pil
+        if cur is None or pil is None or self._canvas_image_id is None or self._is_dragging:
+            return False
+        if cur.size != pil.size:
+            return False
+        z = float(self._zoom or 1.0)
+        if photo.width() != max(1, int(pil.width * z)) or photo.height() != max(1, int(pil.height * z)):
+            return False
+
+        if pil is not self._pil:
+            self._tk_tile_cache.clear()
+        self._pil = pil
+        # Frames are small; render from the base image if a SHARP redraw happens later
+        self._set_pyramid([(1.0, pil)])
+        self._pyr_built_floor = None
+
+        g = self._geom()
+
+        self._tk_image = photo
+        self._tk_image_owned = None
+        self._place_sharp(g.img_x, g.img_y)
+
+        self._tile_box = (0, 0, pil.width, pil.height)
+        self._last_draw_key = None
+        self._last_was_preview = False
+        return True
+
     def zoom_fit(self):
         pil = self._pil
         if pil is None:
             return
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
+        cw, ch = self._canvas_wh()
         iw, ih = pil.size
         if iw <= 0 or ih <= 0:
             return
-        z = min(cw / iw, ch / ih)
-        z = max(0.5, min(16.0, z))
-        self._zoom = z
+        self._zoom = _clamp_zoom(min(cw / iw, ch / ih), self._zoom)[0]
         self._user_panned = False
         self.invalidate_cache()
         self.schedule_redraw(0, force=True)
@@ -200,7 +478,7 @@ class ViewportCanvas(ttk.Frame):
             d = float(delta)
         except Exception:
             d = 0.0
-        if abs(d) < 1e-9:
+        if abs(d) < _ZOOM_EPS:
             return
 
         # Linux (+1/-1)
@@ -208,9 +486,10 @@ class ViewportCanvas(ttk.Frame):
             d = 120.0 if d > 0 else -120.0
 
         base = 1.125
-        new_z = max(0.5, min(16.0, old_z * (base ** (d / 120.0))))
-        if abs(new_z - old_z) < 1e-9:
+        new_z, changed = _clamp_zoom(old_z * (base ** (d / 120.0)), old_z)
+        if not changed:
             return
+        self._note_zoom_input()
 
         pil = self._pil
         if pil is None:
@@ -226,11 +505,8 @@ class ViewportCanvas(ttk.Frame):
         self.invalidate_cache()
         self._ensure_scrollregion(pil)
 
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
-        pad = self._compute_pad(cw, ch)
-        img_x = pad
-        img_y = pad
+        g = self._geom()
+        pad, img_x, img_y = g.pad, g.img_x, g.img_y
 
         ix = (wx - img_x) / old_z
         iy = (wy - img_y) / old_z
@@ -244,10 +520,29 @@ class ViewportCanvas(ttk.Frame):
         scroll_w, scroll_h = self._scrollregion_wh(pil, pad)
         self.canvas.xview_moveto(self._clamp01(left_new / max(1.0, float(scroll_w))))
         self.canvas.yview_moveto(self._clamp01(top_new / max(1.0, float(scroll_h))))
+        self._origin_cache = None
 
         self._user_panned = True
         self.schedule_redraw(0, force=True)
 
+    def _note_zoom_input(self):
+        # Interactive zoom: fast downscale filter until input pauses
+        self._active_downscale = self._downscale_resample
+        if self._zoom_settle_after_id is not None:
+            try:
+                self.after_cancel(self._zoom_settle_after_id)
+            except Exception:
+                pass
+        self._zoom_settle_after_id = self.after(self._zoom_settle_ms, self._zoom_settled)
+
+    def _zoom_settled(self):
+        self._zoom_settle_after_id = None
+        self._active_downscale = self._settled_downscale_resample
+        # Only a downscaled SHARP tile looks any different with the settled filter
+        if self._last_tile_downscaled and not self._is_dragging:
+            self._settle_async = True
+            self.schedule_redraw(0, force=True)
+
     # -----------------------------
     # Pan
     # -----------------------------
@@ -273,7 +568,12 @@ class ViewportCanvas(ttk.Frame):
 
         self._is_dragging = True
         self._user_panned = True
+        self._pan_last_xy = None
+        self._origin_cache = None
+        self._ensure_scrollregion(self._pil)
         self.canvas.scan_mark(x, y)
+        self._pan_mark = (x, y)
+        self._pan_origin = (int(self.canvas.canvasx(0)), int(self.canvas.canvasy(0)))
 
         if self._preview_enabled:
             self._preview_show()
@@ -281,11 +581,31 @@ class ViewportCanvas(ttk.Frame):
     def pan_move(self, x: int, y: int):
         if self._pil is None or not self._is_dragging:
             return
+        self._pan_last_xy = (x, y)
+        if self._pan_pending:
+            return
+        # InputController already hands over one move per idle pass, so an idle
+        # loop gets no extra delay; only faster bursts wait out the frame
+        wait = self._pan_flush_ms - (_now_ms() - self._pan_last_flush_ms)
+        if wait <= 0:
+            self._pan_flush()
+            return
+        self._pan_pending = True
+        self._pan_after_id = self.after(int(math.ceil(wait)), self._pan_flush)
+
+    def _pan_flush(self):
+        self._pan_after_id = None
+        self._pan_pending = False
+        if self._pil is None or not self._is_dragging or self._pan_last_xy is None:
+            return
+        self._pan_last_flush_ms = _now_ms()
+        x, y = self._pan_last_xy
 
         z = float(self._zoom or 1.0)
 
         self._user_panned = True
         self.canvas.scan_dragto(x, y, gain=1)
+        self._origin_cache = self._pan_predict_origin(x, y)
 
         # Update PREVIEW (proxy) frequently (throttled)
         if self._preview_enabled:
@@ -317,11 +637,42 @@ class ViewportCanvas(ttk.Frame):
         if self._near_tile_edge():
             self._schedule_drag_redraw(z, outside_tile=False)
 
+    def _pan_predict_origin(self, x: int, y: int) -> Tuple[float, float]:
+        """
+        View origin after scan_dragto(x, y, gain=1), mirroring Tk's own
+        arithmetic (mark origin minus pointer delta, confined to the
+        scrollregion) instead of asking the canvas.
+        """
+        region = self._scrollregion_last
+        mark, origin = self._pan_mark, self._pan_origin
+        cw, ch = self._cw, self._ch
+        if (
+            region is None or mark is None or origin is None
+            or region[2] - region[0] < cw or region[3] - region[1] < ch
+        ):
+            # not the plain confined case: ask the canvas
+            return float(self.canvas.canvasx(0)), float(self.canvas.canvasy(0))
+        ox = origin[0] - (x - mark[0])
+        oy = origin[1] - (y - mark[1])
+        ox = max(region[0], min(region[2] - cw, ox))
+        oy = max(region[1], min(region[3] - ch, oy))
+        return float(ox), float(oy)
+
     def pan_end(self):
         if not self._is_dragging:
             return
+
+        # apply the last recorded position before leaving drag mode
+        if self._pan_after_id is not None:
+            try:
+                self.after_cancel(self._pan_after_id)
+            except Exception:
+                pass
+            self._pan_flush()
+
         self._is_dragging = False
         self._drag_escape_pending = False
+        self._origin_cache = None
 
         # cancel pending sharp redraw
         if self._view_after_id is not None:
@@ -362,6 +713,7 @@ class ViewportCanvas(ttk.Frame):
     def invalidate_cache(self):
         self._last_draw_key = None
         self._tile_box = None
+        self._pending_tile_key = None
 
     def schedule_redraw(self, delay_ms: int = 0, *, force: bool = False):
         self._force_next_draw = force
@@ -414,30 +766,15 @@ class ViewportCanvas(ttk.Frame):
         if pil is None:
             return None
 
-        z = float(self._zoom or 1.0)
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
-        pad = self._compute_pad(cw, ch)
-        img_x = pad
-        img_y = pad
-
-        left_w0 = float(self.canvas.canvasx(0))
-        top_w0 = float(self.canvas.canvasy(0))
-
-        want_w = cw / z
-        want_h = ch / z
+        g = self._geom()
+        z, cw, ch, pad = g.zoom, g.cw, g.ch, g.pad
 
-        # ideal (unclipped) viewport rect in image coords
-        l0 = (left_w0 - img_x) / z
-        t0 = (top_w0 - img_y) / z
-        r0 = l0 + want_w
-        b0 = t0 + want_h
+        left_w0, top_w0 = self._canvas_origin()
 
-        # clipped crop rect inside image
-        crop_l = max(0.0, min(float(pil.width), l0))
-        crop_t = max(0.0, min(float(pil.height), t0))
-        crop_r = max(0.0, min(float(pil.width), r0))
-        crop_b = max(0.0, min(float(pil.height), b0))
+        # ideal (unclipped) viewport rect in image coords, and its clip to the image
+        (l0, t0, r0, b0, crop_l, crop_t, crop_r, crop_b) = _view_rect(
+            z, float(cw), float(ch), float(pad), left_w0, top_w0, float(pil.width), float(pil.height)
+        )
 
         # if completely outside
         if crop_r <= crop_l or crop_b <= crop_t:
@@ -472,13 +809,16 @@ class ViewportCanvas(ttk.Frame):
         if not self._is_dragging:
             return
 
-        pil = self._pil
-        z = float(self._zoom or 1.0)
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
+        # The SHARP tile sits above the preview and scrolls with the canvas; while it
+        # still covers the visible part of the image the proxy would be hidden anyway
+        if self._tile_box is not None and not self._viewport_outside_tile():
+            if self._preview_visible:
+                self._preview_hide()
+            return
 
-        self._ensure_scrollregion(pil)
+        z = float(self._zoom or 1.0)
 
+        # scrollregion is set at pan_begin; nothing it depends on changes mid-drag
         info = self._preview_rect_and_offsets()
         if info is None:
             return
@@ -486,20 +826,16 @@ class ViewportCanvas(ttk.Frame):
         (l0, t0, r0, b0, cw, ch, dx_px, dy_px,
          crop_l, crop_t, crop_r, crop_b) = info
 
-        # background (match canvas bg "#202020")
-        bg = Image.new("RGB", (cw, ch), (0x20, 0x20, 0x20))
+        bg = self._preview_bg
+        if bg is None or bg.size != (cw, ch):
+            bg = self._preview_bg = Image.new("RGB", (cw, ch), _PREVIEW_BG_RGB)
 
         # If nothing intersects the image, just show bg
         if crop_r <= crop_l or crop_b <= crop_t:
-            self._preview_tk = ImageTk.PhotoImage(bg)
-            x0 = float(self.canvas.canvasx(0))
-            y0 = float(self.canvas.canvasy(0))
-            if self._preview_id is None:
-                self._preview_id = self.canvas.create_image(x0, y0, anchor="nw", image=self._preview_tk)
-            else:
-                self.canvas.coords(self._preview_id, x0, y0)
-                self.canvas.itemconfig(self._preview_id, image=self._preview_tk)
-            self._preview_visible = True
+            bg.paste(_PREVIEW_BG_RGB, (0, 0, cw, ch))
+            self._preview_present(bg)
+            if not self._preview_visible:
+                self._preview_show()
             return
 
         # choose a more-downsampled pyramid for preview
@@ -516,42 +852,70 @@ class ViewportCanvas(ttk.Frame):
         r2 = max(l2 + 1, min(lvl_img.width, r2))
         b2 = max(t2 + 1, min(lvl_img.height, b2))
 
-        cropped = lvl_img.crop((l2, t2, r2, b2))
-
         # On-screen size of the *clipped* crop portion
         crop_w_px = max(1, int(round((crop_r - crop_l) * z)))
         crop_h_px = max(1, int(round((crop_b - crop_t) * z)))
 
         try:
-            scaled = cropped.resize((crop_w_px, crop_h_px), resample=self._preview_resample)
+            if _identity_scale((r2 - l2, b2 - t2), (crop_w_px, crop_h_px), tol=1):
+                # level already matches on-screen size (zoom sits on a pyramid step)
+                scaled = lvl_img.crop((l2, t2, r2, b2))
+            else:
+                # box= resamples straight from the level, skipping an intermediate crop copy.
+                # At integer factors NEAREST is already a plain row/pixel replication in C
+                # (several times faster than a numpy repeat + fromarray round trip).
+                scaled = lvl_img.resize(
+                    (crop_w_px, crop_h_px), resample=self._preview_resample, box=(l2, t2, r2, b2)
+                )
         except Exception:
             return
 
         try:
+            # Only the bands around the crop can hold stale pixels; the crop covers the rest
+            x1 = min(cw, dx_px + scaled.width)
+            y1 = min(ch, dy_px + scaled.height)
+            for band in ((0, 0, cw, dy_px), (0, y1, cw, ch), (0, dy_px, dx_px, y1), (x1, dy_px, cw, y1)):
+                if band[2] > band[0] and band[3] > band[1]:
+                    bg.paste(_PREVIEW_BG_RGB, band)
             bg.paste(scaled, (dx_px, dy_px))
         except Exception:
             return
 
-        self._preview_tk = ImageTk.PhotoImage(bg)
-
-        # Screen-pinned placement
-        x0 = float(self.canvas.canvasx(0))
-        y0 = float(self.canvas.canvasy(0))
-
-        if self._preview_id is None:
-            self._preview_id = self.canvas.create_image(x0, y0, anchor="nw", image=self._preview_tk)
-        else:
-            self.canvas.coords(self._preview_id, x0, y0)
-            self.canvas.itemconfig(self._preview_id, image=self._preview_tk)
+        self._preview_present(bg)
 
         # keep preview below sharp
-        if self._canvas_image_id is not None:
+        if self._canvas_image_id is not None and not self._sharp_above_preview:
             try:
                 self.canvas.tag_lower(self._preview_id, self._canvas_image_id)
-            except Exception:
+                self._sharp_above_preview = True
+            except tk.TclError:
                 pass
 
-        self._preview_visible = True
+        if not self._preview_visible:
+            self._preview_show()
+
+    def _preview_present(self, bg: Image.Image):
+        """
+        Show bg as the screen-pinned preview. Same-sized frames are pasted into
+        the existing PhotoImage, so the canvas item keeps its image and only moves.
+        """
+        tk_img = self._preview_tk
+        if tk_img is not None and (tk_img.width(), tk_img.height()) == bg.size:
+            tk_img.paste(bg)
+            new_image = False
+        else:
+            tk_img = self._preview_tk = ImageTk.PhotoImage(bg)
+            new_image = True
+
+        # Screen-pinned placement
+        x0, y0 = self._canvas_origin()
+        if self._preview_id is None:
+            self._preview_id = self.canvas.create_image(x0, y0, anchor="nw", image=tk_img)
+            self._sharp_above_preview = False
+        else:
+            self.canvas.coords(self._preview_id, x0, y0)
+            if new_image:
+                self.canvas.itemconfig(self._preview_id, image=tk_img)
 
     def _preview_show(self):
         if self._preview_id is not None:
@@ -573,16 +937,40 @@ class ViewportCanvas(ttk.Frame):
     # Scrollbar callbacks
     # -----------------------------
     def _on_xscroll(self, lo, hi):
-        self._xsb.set(lo, hi)
-        if not self._is_dragging:
-            self.schedule_redraw(16, force=False)
+        self._origin_cache = None
+        self._sb_x = (lo, hi)
+        self._queue_sb()
 
     def _on_yscroll(self, lo, hi):
-        self._ysb.set(lo, hi)
-        if not self._is_dragging:
+        self._origin_cache = None
+        self._sb_y = (lo, hi)
+        self._queue_sb()
+
+    def _queue_sb(self):
+        if not self._sb_pending:
+            self._sb_pending = True
+            self.after_idle(self._flush_sb)
+
+    def _flush_sb(self):
+        # Latest (lo, hi) per axis wins; one redraw for the whole burst
+        self._sb_pending = False
+        if self._sb_x is not None:
+            self._xsb.set(*self._sb_x)
+        if self._sb_y is not None:
+            self._ysb.set(*self._sb_y)
+        # A redraw already queued (possibly forced, e.g. by wheel_zoom) sees the new view too
+        if not self._is_dragging and self._view_after_id is None:
             self.schedule_redraw(16, force=False)
 
     def _on_configure(self, event):
+        self._cw = max(1, event.width)
+        self._ch = max(1, event.height)
+        self._origin_cache = None
+        built = self._pyr_built_floor
+        if built is not None:
+            ratio = max(1, self._pyr_useful_floor()) / max(1, built)
+            if ratio > self._pyr_rebuild_ratio or ratio * self._pyr_rebuild_ratio < 1.0:
+                self._submit_pyramid_build()
         self.schedule_redraw(0, force=True)
         if self._is_dragging and self._preview_enabled:
             self._draw_preview_now()
@@ -619,15 +1007,27 @@ class ViewportCanvas(ttk.Frame):
 
         return margin, quant, debounce
 
+    def _drag_min_intervals(self, z: float) -> Tuple[float, float, float]:
+        memo = self._drag_min_memo
+        if memo is not None and memo[0] == z:
+            return memo[1]
+        t = self._zoom_t(z)
+        drag_min = self._drag_min_interval_ms_low_zoom + (self._drag_min_interval_ms_high_zoom - self._drag_min_interval_ms_low_zoom) * t
+        drag_min_outside = max(drag_min, self._drag_outside_tile_min_interval_ms_high_zoom * t)
+        escape_min = self._drag_freeze_escape_min_interval_ms_low_zoom + (
+            self._drag_freeze_escape_min_interval_ms_high_zoom - self._drag_freeze_escape_min_interval_ms_low_zoom
+        ) * t
+        vals = (drag_min, drag_min_outside, escape_min)
+        self._drag_min_memo = (z, vals)
+        return vals
+
     # -----------------------------
     # Drag redraw throttle (fallback)
     # -----------------------------
     def _schedule_drag_redraw(self, z: float, *, outside_tile: bool):
         now = _now_ms()
-        t = self._zoom_t(z)
-        base_min = self._drag_min_interval_ms_low_zoom + (self._drag_min_interval_ms_high_zoom - self._drag_min_interval_ms_low_zoom) * t
-        if outside_tile:
-            base_min = max(base_min, self._drag_outside_tile_min_interval_ms_high_zoom * t)
+        drag_min, drag_min_outside, _ = self._drag_min_intervals(z)
+        base_min = drag_min_outside if outside_tile else drag_min
 
         elapsed = now - self._drag_last_redraw_ms
         if elapsed >= base_min:
@@ -642,10 +1042,7 @@ class ViewportCanvas(ttk.Frame):
     # -----------------------------
     def _schedule_drag_escape_redraw(self, z: float):
         now = _now_ms()
-        t = self._zoom_t(z)
-        base_min = self._drag_freeze_escape_min_interval_ms_low_zoom + (
-            self._drag_freeze_escape_min_interval_ms_high_zoom - self._drag_freeze_escape_min_interval_ms_low_zoom
-        ) * t
+        base_min = self._drag_min_intervals(z)[2]
 
         elapsed = now - self._drag_last_escape_redraw_ms
         if elapsed >= base_min:
@@ -658,11 +1055,35 @@ class ViewportCanvas(ttk.Frame):
     # -----------------------------
     # Pyramid
     # -----------------------------
-    def _build_pyramid(self, pil: Image.Image):
-        self._pyr = []
-        if pil is None:
+    def _set_pyramid(self, levels: List[Tuple[float, Image.Image]]):
+        self._pyr = levels
+        self._pyr_log2 = [math.log2(scale) for scale, _ in levels]
+        self._pyr_pick_memo.clear()
+
+    def _pyr_useful_floor(self) -> int:
+        # Level side below which further levels stop paying off for this canvas
+        return min(self._cw, self._ch) // 2
+
+    def _submit_pyramid_build(self):
+        pil = self._pil
+        self._pyr_built_floor = None
+        if pil is None or self._pyr_levels <= 1 or min(pil.size) <= self._pyr_min_dim:
             return
-        self._pyr.append((1.0, pil))
+        floor = self._pyr_useful_floor()
+        self._pyr_built_floor = floor
+        self._pyr_pool.submit(self._build_pyramid_bg, pil, floor)
+
+    def _pyramid_levels(self, pil: Image.Image, min_useful: int = 0) -> List[Tuple[float, Image.Image]]:
+        # Levels stay PIL images: the preview resamples straight from them with
+        # resize(box=), and PhotoImage.paste needs an Image anyway. np.asarray()
+        # of a PIL image is a tobytes() copy, not a view, so ndarray levels
+        # would only double the pyramid's memory.
+        # Opaque RGBA: the reduced levels drop the constant alpha plane, so their
+        # resamples skip Pillow's premultiply/unpremultiply passes (~1.8x faster
+        # bilinear downscale). The base stays the caller's image (already held
+        # as self._pil) rather than a second full-size RGB copy.
+        opaque = pil.mode == "RGBA" and pil.getchannel("A").getextrema() == (255, 255)
+        levels = [(1.0, pil)]
 
         w, h = pil.size
         scale = 1.0
@@ -670,59 +1091,109 @@ class ViewportCanvas(ttk.Frame):
         for _ in range(max(0, int(self._pyr_levels) - 1)):
             if min(w, h) <= self._pyr_min_dim:
                 break
-            w = max(1, w // 2)
-            h = max(1, h // 2)
+            # SHARP wants a level at the zoom-out limit; the preview picker wants the
+            # smallest level, so keep one under the floor before stopping
+            if scale <= _ZOOM_MIN and min(w, h) < min_useful:
+                break
+            # exact 2x2 box average (rounds odd sizes up)
+            cur = cur.reduce(2)
+            if opaque and cur.mode == "RGBA":
+                cur = cur.convert("RGB")
+            w, h = cur.size
             scale *= 0.5
-            cur = cur.resize((w, h), resample=self._pyr_downsample_resample)
-            self._pyr.append((scale, cur))
-
-    def _pick_pyr_level(self, zoom: float) -> Tuple[float, Image.Image, float]:
-        if not self._pyr:
-            return 1.0, self._pil, float(zoom)
+            levels.append((scale, cur))
+        return levels
 
-        best = None
-        for scale, img in self._pyr:
-            rel = zoom / scale
-            score = abs(math.log(rel, 2)) if rel > 0 else 1e9
-            bias = self._pyr_bias_down * (-math.log(scale, 2))
-            score -= bias
-            if best is None or score < best[0]:
-                best = (score, scale, img, rel)
+    def _build_pyramid_bg(self, pil: Image.Image, min_useful: int):
+        # Worker thread: skip images that were replaced (or builds superseded) while queued
+        if self._pil is not pil or self._pyr_built_floor != min_useful:
+            return
+        levels = self._pyramid_levels(pil, min_useful)
+        self._post(self._install_pyramid, pil, levels)
 
-        _, scale, img, rel = best
-        return scale, img, rel
+    def _install_pyramid(self, pil: Image.Image, levels: List[Tuple[float, Image.Image]]):
+        if self._pil is not pil:
+            return
+        if len(levels) == len(self._pyr) and all(a[0] == b[0] for a, b in zip(levels, self._pyr)):
+            return  # a rebuild produced the same level set
+        self._set_pyramid(levels)
+        # Only re-render if the current zoom now prefers a smaller level
+        if self._pick_pyr_level(float(self._zoom or 1.0))[0] != 1.0:
+            self.invalidate_cache()
+            self.schedule_redraw(0, force=False)
 
-    def _pick_pyr_level_preview(self, zoom: float) -> Tuple[float, Image.Image, float]:
+    def _pick_level(self, zoom: float, bias_down: float) -> Tuple[float, Image.Image, float]:
+        """
+        Level minimising |log2(zoom / scale)| - bias_down * -log2(scale).
+        At most one log per call (none for a memoized zoom); the per-level
+        logs come from _set_pyramid().
+        """
         if not self._pyr:
             return 1.0, self._pil, float(zoom)
+        if zoom <= 0:
+            scale, img = self._pyr[0]
+            return scale, img, zoom / scale
+
+        memo = self._pyr_pick_memo
+        best_i = memo.get((zoom, bias_down))
+        if best_i is None:
+            lz = math.log2(zoom)
+            best_i = 0
+            best_score = None
+            for i, ls in enumerate(self._pyr_log2):
+                score = abs(lz - ls) + bias_down * ls
+                if best_score is None or score < best_score:
+                    best_i, best_score = i, score
+            if len(memo) >= 64:
+                memo.clear()
+            memo[(zoom, bias_down)] = best_i
+
+        scale, img = self._pyr[best_i]
+        return scale, img, zoom / scale
 
-        best = None
-        for scale, img in self._pyr:
-            rel = zoom / scale
-            score = abs(math.log(rel, 2)) if rel > 0 else 1e9
-            bias = (self._pyr_bias_down + self._preview_bias_down_extra) * (-math.log(scale, 2))
-            score -= bias
-            if best is None or score < best[0]:
-                best = (score, scale, img, rel)
+    def _pick_pyr_level(self, zoom: float) -> Tuple[float, Image.Image, float]:
+        return self._pick_level(zoom, self._pyr_bias_down)
 
-        _, scale, img, rel = best
-        return scale, img, rel
+    def _pick_pyr_level_preview(self, zoom: float) -> Tuple[float, Image.Image, float]:
+        return self._pick_level(zoom, self._pyr_bias_down + self._preview_bias_down_extra)
 
     # -----------------------------
     # Geometry helpers
     # -----------------------------
-    def _ensure_scrollregion(self, pil):
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
+    def _canvas_wh(self) -> Tuple[int, int]:
+        return self._cw, self._ch
+
+    def _geom(self) -> Geom:
+        cw, ch = self._cw, self._ch
         pad = self._compute_pad(cw, ch)
-        scroll_w, scroll_h = self._scrollregion_wh(pil, pad)
-        self.canvas.configure(scrollregion=(0, 0, scroll_w, scroll_h))
+        return Geom(cw, ch, pad, pad, pad, float(self._zoom or 1.0))
+
+    def _canvas_origin(self) -> Tuple[float, float]:
+        # World coords of the canvas' top-left pixel; canvasx(cw) == left + cw
+        o = self._origin_cache
+        if o is not None:
+            return o
+        return float(self.canvas.canvasx(0)), float(self.canvas.canvasy(0))
+
+    def _ensure_scrollregion(self, pil):
+        scroll_w, scroll_h = self._scrollregion_wh(pil, self._geom().pad)
+        region = (0, 0, scroll_w, scroll_h)
+        if region == self._scrollregion_last:
+            return  # unchanged: skip the Tcl configure round-trip
+        self.canvas.configure(scrollregion=region)
+        self._scrollregion_last = region
 
     def _scrollregion_wh(self, pil, pad: int):
         z = float(self._zoom or 1.0)
+        key = (pil.width, pil.height, z, pad)
+        memo = self._scroll_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
         zw = max(1, int(pil.width * z))
         zh = max(1, int(pil.height * z))
-        return zw + 2 * pad, zh + 2 * pad
+        wh = (zw + 2 * pad, zh + 2 * pad)
+        self._scroll_memo = (key, wh)
+        return wh
 
     def _compute_pad(self, canvas_w: int, canvas_h: int) -> int:
         if self._pad_mode == "auto":
@@ -735,38 +1206,18 @@ class ViewportCanvas(ttk.Frame):
     def _screen_to_image_px(self, px_screen: int, z: float) -> int:
         return max(1, int(px_screen / max(1e-9, z)))
 
-    def _quantize_floor(self, v: int, q: int) -> int:
-        return (v // q) * q
-
-    def _quantize_ceil(self, v: int, q: int) -> int:
-        return ((v + q - 1) // q) * q
-
     def _visible_rect_image_coords(self):
         pil = self._pil
         if pil is None:
             return None
 
-        z = float(self._zoom or 1.0)
-        cw = max(1, self.canvas.winfo_width())
-        ch = max(1, self.canvas.winfo_height())
-        pad = self._compute_pad(cw, ch)
-        img_x = pad
-        img_y = pad
-
-        left_w0 = float(self.canvas.canvasx(0))
-        top_w0 = float(self.canvas.canvasy(0))
-        right_w0 = float(self.canvas.canvasx(cw))
-        bot_w0 = float(self.canvas.canvasy(ch))
-
-        vis_l = (left_w0 - img_x) / z
-        vis_t = (top_w0 - img_y) / z
-        vis_r = (right_w0 - img_x) / z
-        vis_b = (bot_w0 - img_y) / z
+        g = self._geom()
+        z, cw, ch, pad = g.zoom, g.cw, g.ch, g.pad
 
-        vis_l = max(0.0, min(float(pil.width), vis_l))
-        vis_r = max(0.0, min(float(pil.width), vis_r))
-        vis_t = max(0.0, min(float(pil.height), vis_t))
-        vis_b = max(0.0, min(float(pil.height), vis_b))
+        left_w0, top_w0 = self._canvas_origin()
+        vis_l, vis_t, vis_r, vis_b = _view_rect(
+            z, float(cw), float(ch), float(pad), left_w0, top_w0, float(pil.width), float(pil.height)
+        )[4:]
         return vis_l, vis_t, vis_r, vis_b, cw, ch
 
     def _viewport_outside_tile(self) -> bool:
@@ -822,6 +1273,7 @@ class ViewportCanvas(ttk.Frame):
             return
 
         z = float(self._zoom or 1.0)
+        settle_async, self._settle_async = self._settle_async, False
 
         r = self._visible_rect_image_coords()
         if r is None:
@@ -844,6 +1296,7 @@ class ViewportCanvas(ttk.Frame):
             target_top = center_y - (ch / 2.0)
             self.canvas.xview_moveto(self._clamp01(target_left / max(1.0, float(scroll_w))))
             self.canvas.yview_moveto(self._clamp01(target_top / max(1.0, float(scroll_h))))
+            self._origin_cache = None
             r2 = self._visible_rect_image_coords()
             if r2 is None:
                 return
@@ -857,112 +1310,187 @@ class ViewportCanvas(ttk.Frame):
                 vis_r <= tr - inner_img and vis_b <= tb - inner_img):
                 return
 
+        dragging = bool(self._is_dragging)
+
         # margins / quant
-        if self._is_dragging:
+        if dragging:
             margin_screen, quant_screen, _ = self._scaled_drag_params(z)
         else:
             margin_screen = self._idle_margin_screen
             quant_screen = 1
 
-        # World rect
-        left_w0 = float(self.canvas.canvasx(0))
-        top_w0 = float(self.canvas.canvasy(0))
-        right_w0 = float(self.canvas.canvasx(cw))
-        bot_w0 = float(self.canvas.canvasy(ch))
-
-        left_w = left_w0 - margin_screen
-        top_w = top_w0 - margin_screen
-        right_w = right_w0 + margin_screen
-        bot_w = bot_w0 + margin_screen
-
-        l_ix = (left_w - img_x) / z
-        r_ix = (right_w - img_x) / z
-        t_iy = (top_w - img_y) / z
-        b_iy = (bot_w - img_y) / z
-
-        l_ix = max(0.0, min(float(pil.width), l_ix))
-        r_ix = max(0.0, min(float(pil.width), r_ix))
-        t_iy = max(0.0, min(float(pil.height), t_iy))
-        b_iy = max(0.0, min(float(pil.height), b_iy))
-        if r_ix <= l_ix or b_iy <= t_iy:
-            return
-
-        quant_img = self._screen_to_image_px(int(quant_screen), z)
-
-        crop_l = int(l_ix)
-        crop_t = int(t_iy)
-        crop_r = int(r_ix + 0.999)
-        crop_b = int(b_iy + 0.999)
-
-        # Quantize BOTH sides for stability
-        if quant_img > 1:
-            crop_l = self._quantize_floor(crop_l, quant_img)
-            crop_t = self._quantize_floor(crop_t, quant_img)
-            crop_r = self._quantize_ceil(crop_r, quant_img)
-            crop_b = self._quantize_ceil(crop_b, quant_img)
-
-        crop_r = max(crop_l + 1, min(pil.width, crop_r))
-        crop_b = max(crop_t + 1, min(pil.height, crop_b))
-
-        self._tile_box = (crop_l, crop_t, crop_r, crop_b)
-
         # Pyramid level
         lvl_scale, lvl_img, rel = self._pick_pyr_level(z)
 
-        l2 = int(crop_l * lvl_scale)
-        t2 = int(crop_t * lvl_scale)
-        r2 = max(l2 + 1, int(math.ceil(crop_r * lvl_scale)))
-        b2 = max(t2 + 1, int(math.ceil(crop_b * lvl_scale)))
-
-        r2 = min(lvl_img.width, r2)
-        b2 = min(lvl_img.height, b2)
+        # World rect (view + margin) -> tile in image, level and screen px
+        left_w0, top_w0 = self._canvas_origin()
+        quant_img = self._screen_to_image_px(int(quant_screen), z)
+        (ok, crop_l, crop_t, crop_r, crop_b,
+         l2, t2, r2, b2, target_w, target_h) = _tile_geom(
+            float(left_w0), float(top_w0), float(cw), float(ch), float(margin_screen),
+            float(img_x), float(img_y), z, float(pil.width), float(pil.height),
+            quant_img, float(lvl_scale), lvl_img.width, lvl_img.height,
+        )
+        if not ok:
+            return
 
-        # Target size in screen px
-        target_w = max(1, int((crop_r - crop_l) * z))
-        target_h = max(1, int((crop_b - crop_t) * z))
+        prev_tile_box = self._tile_box
+        self._tile_box = (crop_l, crop_t, crop_r, crop_b)
+        # Only filtered downscales depend on the quality tier; crops and exact
+        # reduce() tiles come out the same, so they skip the settle redraw
+        filtered = rel < 1.0 and _downscale_uses_filter((r2 - l2, b2 - t2), (target_w, target_h))
 
         draw_key = (
             id(pil), z,
             crop_l, crop_t, crop_r, crop_b,
             lvl_scale, l2, t2, r2, b2,
             target_w, target_h,
-            bool(self._is_dragging),
+            dragging,
+            self._active_downscale if filtered else None,
             int(margin_screen), int(quant_screen),
         )
+        # The tile is world-anchored and its crop is quantized to quant_screen, so small
+        # pans land on the same key and need no move: the canvas scroll carries the item
         if draw_key == self._last_draw_key and self._tk_image is not None and not force:
             return
+        if draw_key == self._pending_tile_key and not force:
+            return  # already being resampled on the worker
+        self._pending_tile_key = None
 
-        cropped = lvl_img.crop((l2, t2, r2, b2))
+        prev_was_preview = self._last_was_preview
+        self._last_was_preview = dragging
+        self._last_tile_downscaled = (not dragging) and filtered
+        world_draw_x = int(round(img_x + crop_l * z))
+        world_draw_y = int(round(img_y + crop_t * z))
 
-        if self._is_dragging:
-            resample = Image.NEAREST
-            self._last_was_preview = True
+        # Settled tiles are kept per draw_key so panning/zooming back reuses them
+        cached = None if dragging else self._tk_tile_cache.get(draw_key)
+        if cached is not None and cached[0] is pil:
+            self._tk_tile_cache.move_to_end(draw_key)
+            self._tk_image = cached[1]
+            self._tk_image_owned = None
         else:
-            resample = self._downscale_resample if rel < 1.0 else self._upscale_resample
-            self._last_was_preview = False
+            box = (l2, t2, r2, b2)
+            resample, reducing_gap = self._tile_filter(dragging, rel)
+            if (
+                settle_async and rel < 1.0 and target_w * target_h > self._async_tile_px
+                and self._tk_image is not None and not prev_was_preview
+                and prev_tile_box == self._tile_box
+            ):
+                # Same rect already on screen with the interim filter: upgrade it off-thread
+                self._pending_tile_key = draw_key
+                self._pyr_pool.submit(
+                    self._render_tile_bg, draw_key, pil, lvl_img, box, (target_w, target_h),
+                    resample, reducing_gap, world_draw_x, world_draw_y,
+                )
+                return
+            scaled = self._render_tile(lvl_img, box, (target_w, target_h), resample, reducing_gap)
+            if dragging:
+                if self._tk_image_owned == (scaled.mode, scaled.size):
+                    # same-shaped tile: blit into the existing photo instead of allocating one
+                    self._tk_image.paste(scaled)
+                else:
+                    self._tk_image = ImageTk.PhotoImage(scaled)
+                    self._tk_image_owned = (scaled.mode, scaled.size)
+            else:
+                self._store_settled_tile(draw_key, pil, scaled)
 
-        scaled = cropped.resize((target_w, target_h), resample=resample)
-        self._tk_image = ImageTk.PhotoImage(scaled)
+        self._show_sharp(world_draw_x, world_draw_y)
+        self._last_draw_key = draw_key
 
-        world_draw_x = int(round(img_x + crop_l * z))
-        world_draw_y = int(round(img_y + crop_t * z))
+    def _store_settled_tile(self, draw_key: tuple, pil: Image.Image, scaled: Image.Image):
+        # Cached photos are only written again once evicted: a same-shaped
+        # eviction is recycled instead of allocating a new Tk image
+        shape = (scaled.mode, scaled.size)
+        photo = None
+        self._tk_tile_cache.pop(draw_key, None)
+        while len(self._tk_tile_cache) >= self._tk_tile_cache_max:
+            _, (_, old_photo, old_shape) = self._tk_tile_cache.popitem(last=False)
+            if photo is None and old_shape == shape and old_photo is not self._tk_image:
+                old_photo.paste(scaled)
+                photo = old_photo
+        if photo is None:
+            photo = ImageTk.PhotoImage(scaled)
+        self._tk_image = photo
+        self._tk_image_owned = None
+        self._tk_tile_cache[draw_key] = (pil, photo, shape)
+
+    def _render_tile_bg(self, draw_key: tuple, pil: Image.Image, lvl_img: Image.Image,
+                        box: Tuple[int, int, int, int], size: Tuple[int, int],
+                        resample, reducing_gap, x: int, y: int):
+        # Worker thread: drop jobs superseded by a newer draw while queued
+        if self._pending_tile_key != draw_key:
+            return
+        scaled = self._render_tile(lvl_img, box, size, resample, reducing_gap)
+        self._post(self._install_tile, draw_key, pil, scaled, x, y)
 
+    def _install_tile(self, draw_key: tuple, pil: Image.Image, scaled: Image.Image, x: int, y: int):
+        if self._pending_tile_key != draw_key:
+            return
+        # Clear the key even when the result is dropped, so the next redraw of
+        # this rect renders it again instead of waiting on a finished job
+        self._pending_tile_key = None
+        if self._pil is not pil or self._is_dragging:
+            return
+        self._store_settled_tile(draw_key, pil, scaled)
+        self._show_sharp(x, y)
+        self._last_draw_key = draw_key
+
+    def _show_sharp(self, world_draw_x: int, world_draw_y: int):
         if self._canvas_image_id is None:
             self._canvas_image_id = self.canvas.create_image(
                 world_draw_x, world_draw_y, anchor="nw", image=self._tk_image
             )
+            self._sharp_above_preview = False
+            self._sharp_shown = (self._tk_image, world_draw_x, world_draw_y)
         else:
-            self.canvas.coords(self._canvas_image_id, world_draw_x, world_draw_y)
-            self.canvas.itemconfig(self._canvas_image_id, image=self._tk_image)
+            self._place_sharp(world_draw_x, world_draw_y)
 
         # keep sharp above preview
-        if self._preview_id is not None:
+        if self._preview_id is not None and not self._sharp_above_preview:
             try:
                 self.canvas.tag_raise(self._canvas_image_id, self._preview_id)
-            except Exception:
+                self._sharp_above_preview = True
+            except tk.TclError:
                 pass
 
-        self._last_draw_key = draw_key
+    def _place_sharp(self, x: int, y: int):
+        # Only send the Tcl commands whose values changed since the last placement
+        shown = self._sharp_shown
+        if shown is None or shown[1] != x or shown[2] != y:
+            self.canvas.coords(self._canvas_image_id, x, y)
+        if shown is None or shown[0] is not self._tk_image:
+            self.canvas.itemconfig(self._canvas_image_id, image=self._tk_image)
+        self._sharp_shown = (self._tk_image, x, y)
+
+    def _tile_filter(self, dragging: bool, rel: float):
+        """(resample, reducing_gap) for a SHARP tile."""
+        if dragging:
+            # NEAREST is Pillow's strided gather in C; cheaper than an ndarray view + frombuffer
+            return Image.NEAREST, None
+        if rel < 1.0:
+            # reducing_gap lets Pillow run an integer reduce() before filtering large downscales
+            return self._active_downscale, 2.0
+        return self._upscale_resample, None
+
+    @staticmethod
+    def _render_tile(lvl_img: Image.Image, box: Tuple[int, int, int, int],
+                     size: Tuple[int, int], resample, reducing_gap) -> Image.Image:
+        # Also runs on _pyr_pool (settled upgrades): reads only its arguments
+        src_w, src_h = box[2] - box[0], box[3] - box[1]
+        if _identity_scale((src_w, src_h), size):
+            return lvl_img.crop(box)
+        if reducing_gap is not None:
+            k = _reduce_factor((src_w, src_h), size)
+            if k:
+                # integer downscale: one k x k box average (same filter the pyramid levels use;
+                # Pillow premultiplies alpha for RGBA, which a hand-rolled kernel would have to match)
+                reduced = lvl_img.reduce(k, box=box)
+                if reduced.size == size:
+                    return reduced
+                return reduced.resize(size, resample=resample)
+        # box= resamples from the level directly, without an intermediate crop
+        return lvl_img.resize(size, resample=resample, box=box, reducing_gap=reducing_gap)
 
     # -----------------------------
     # Misc helpers